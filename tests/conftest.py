@@ -19,6 +19,21 @@ if TYPE_CHECKING:
     pass
 
 
+@pytest.fixture(autouse=True)
+def close_shared_database_connections():
+    """Close WeatherDatabase's shared connections after each test.
+
+    Tests create and delete many database files, so don't let their handles
+    or cached read results outlive the test that opened them.
+    """
+    yield
+    from weather_app.database.engine import WeatherDatabase
+    from weather_app.database.repository import WeatherRepository
+
+    WeatherDatabase.close_shared()
+    WeatherRepository.clear_cache()
+
+
 @pytest.fixture
 def test_db():
     """Create a temporary test database.
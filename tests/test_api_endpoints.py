@@ -208,6 +208,28 @@ class TestWeatherEndpoint:
 
         assert len(data) == 2
 
+    @pytest.mark.unit
+    def test_get_weather_with_cursor(self, client_with_data):
+        """GET /weather?cursor=... should return records after the cursor."""
+        first = client_with_data.get("/weather?limit=1").json()
+        response = client_with_data.get(
+            f"/weather?limit=10&cursor={first[0]['dateutc']}"
+        )
+        assert response.status_code == 200
+        data = response.json()
+
+        assert len(data) == 2
+        assert all(r["dateutc"] < first[0]["dateutc"] for r in data)
+
+    @pytest.mark.unit
+    def test_get_weather_cursor_with_offset_rejected(self, client_with_data):
+        """GET /weather with both cursor and offset should return 400."""
+        first = client_with_data.get("/weather?limit=1").json()
+        response = client_with_data.get(
+            f"/weather?limit=10&offset=1&cursor={first[0]['dateutc']}"
+        )
+        assert response.status_code == 400
+
     @pytest.mark.unit
     def test_get_weather_with_date_filter(self, client_with_data):
         """GET /weather with date filters should filter results."""
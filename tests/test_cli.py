@@ -224,9 +224,7 @@ class TestFetchCommand:
                 "os.environ",
                 {"AMBIENT_API_KEY": "key", "AMBIENT_APP_KEY": "app"},
             ):
-                with patch.object(
-                    cli_module, "AmbientWeatherAPI", return_value=mock_api
-                ):
+                with patch("weather_app.api.AmbientWeatherAPI", return_value=mock_api):
                     with patch("time.sleep"):  # Skip delays
                         result = runner.invoke(cli, ["fetch", "--limit", "2"])
 
@@ -254,9 +252,7 @@ class TestFetchCommand:
                 "os.environ",
                 {"AMBIENT_API_KEY": "key", "AMBIENT_APP_KEY": "app"},
             ):
-                with patch.object(
-                    cli_module, "AmbientWeatherAPI", return_value=mock_api
-                ):
+                with patch("weather_app.api.AmbientWeatherAPI", return_value=mock_api):
                     result = runner.invoke(cli, ["fetch"])
 
         assert result.exit_code == 1
@@ -490,6 +486,82 @@ class TestExportCommand:
         assert "No data found" in result.output
 
 
+# =============================================================================
+# IMPORT COMMAND TESTS
+# =============================================================================
+
+
+class TestImportCommand:
+    """Tests for the import command."""
+
+    @pytest.mark.unit
+    def test_import_requires_csv(self, runner):
+        """import should require a CSV path."""
+        result = runner.invoke(cli, ["import"])
+        assert result.exit_code != 0
+        assert "Missing option" in result.output or "required" in result.output.lower()
+
+    @pytest.mark.unit
+    def test_import_requires_database(self, runner, temp_db_dir):
+        """import should fail if database doesn't exist."""
+        db_path = temp_db_dir / "nonexistent.duckdb"
+        csv_path = temp_db_dir / "input.csv"
+        csv_path.write_text("dateutc,date\n1704110400000,2024-01-01T12:00:00\n")
+
+        with patch.object(cli_module, "DB_PATH", str(db_path)):
+            result = runner.invoke(cli, ["import", "--csv", str(csv_path)])
+
+        assert result.exit_code == 1
+        assert "Database not found" in result.output
+
+    @pytest.mark.unit
+    def test_import_round_trips_export(self, runner, temp_db_dir):
+        """import should load a CSV written by export and skip existing rows."""
+        source_path = temp_db_dir / "source.duckdb"
+        db_path = temp_db_dir / "test.duckdb"
+        csv_path = temp_db_dir / "export.csv"
+
+        from weather_app.database.engine import WeatherDatabase
+
+        with WeatherDatabase(str(source_path)) as db:
+            db.insert_data(
+                [
+                    {
+                        "dateutc": 1704110400000,
+                        "date": "2024-01-01T12:00:00",
+                        "tempf": 72.5,
+                        "humidity": 45,
+                    },
+                    {
+                        "dateutc": 1704114000000,
+                        "date": "2024-01-01T13:00:00",
+                        "tempf": 74.0,
+                    },
+                ]
+            )
+        with WeatherDatabase(str(db_path)) as db:
+            db.insert_data(
+                {"dateutc": 1704110400000, "date": "2024-01-01T12:00:00", "tempf": 60.0}
+            )
+
+        with patch.object(cli_module, "DB_PATH", str(source_path)):
+            runner.invoke(cli, ["export", "-o", str(csv_path)])
+        with patch.object(cli_module, "DB_PATH", str(db_path)):
+            result = runner.invoke(cli, ["import", "--csv", str(csv_path)])
+
+        assert result.exit_code == 0
+        assert "Imported 1 new records (2 total)" in result.output
+
+        with WeatherDatabase(str(db_path)) as db:
+            rows = db.get_data(order_by="dateutc ASC")
+        assert [row["date"] for row in rows] == [
+            "2024-01-01T12:00:00",
+            "2024-01-01T13:00:00",
+        ]
+        assert rows[0]["tempf"] == 60.0
+        assert rows[1]["tempf"] == 74.0
+
+
 # =============================================================================
 # INFO COMMAND TESTS
 # =============================================================================
@@ -689,6 +761,7 @@ class TestDemoGenerateCommand:
         assert "--output" in result.output
         assert "--start-date" in result.output
         assert "--force" in result.output
+        assert "--seed" in result.output
 
     @pytest.mark.unit
     def test_demo_generate_default_values(self, runner):
@@ -921,9 +994,7 @@ class TestFetchCommandAdditional:
                 "os.environ",
                 {"AMBIENT_API_KEY": "key", "AMBIENT_APP_KEY": "app"},
             ):
-                with patch.object(
-                    cli_module, "AmbientWeatherAPI", return_value=mock_api
-                ):
+                with patch("weather_app.api.AmbientWeatherAPI", return_value=mock_api):
                     with patch("time.sleep"):
                         result = runner.invoke(cli, ["fetch"])
 
@@ -951,9 +1022,7 @@ class TestFetchCommandAdditional:
                 "os.environ",
                 {"AMBIENT_API_KEY": "key", "AMBIENT_APP_KEY": "app"},
             ):
-                with patch.object(
-                    cli_module, "AmbientWeatherAPI", return_value=mock_api
-                ):
+                with patch("weather_app.api.AmbientWeatherAPI", return_value=mock_api):
                     result = runner.invoke(cli, ["fetch"])
 
         assert result.exit_code == 1
@@ -1005,9 +1074,7 @@ class TestBackfillCommandAdditional:
                 "os.environ",
                 {"AMBIENT_API_KEY": "key", "AMBIENT_APP_KEY": "app"},
             ):
-                with patch.object(
-                    cli_module, "AmbientWeatherAPI", return_value=mock_api
-                ):
+                with patch("weather_app.api.AmbientWeatherAPI", return_value=mock_api):
                     result = runner.invoke(
                         cli,
                         ["backfill", "--start", "2024-01-01", "--end", "2024-01-02"],
@@ -1016,6 +1083,140 @@ class TestBackfillCommandAdditional:
         assert result.exit_code == 1
         assert "No devices found" in result.output
 
+    @staticmethod
+    def _backfill_api(fetch):
+        """Mock API with one device whose historical fetch runs fetch()."""
+        mock_api = MagicMock()
+        mock_api.get_devices.return_value = [
+            {"macAddress": "AA:BB:CC:DD:EE:FF", "info": {"name": "Station"}}
+        ]
+        mock_api.fetch_all_historical_data.side_effect = fetch
+        mock_api.__enter__ = MagicMock(return_value=mock_api)
+        mock_api.__exit__ = MagicMock(return_value=False)
+        return mock_api
+
+    def _run_backfill(self, runner, db_path, mock_api):
+        """Run backfill for January 2024 against db_path with mock_api."""
+        with patch.object(cli_module, "DB_PATH", str(db_path)):
+            with patch.dict(
+                "os.environ",
+                {"AMBIENT_API_KEY": "key", "AMBIENT_APP_KEY": "app"},
+            ):
+                with patch("weather_app.api.AmbientWeatherAPI", return_value=mock_api):
+                    return runner.invoke(
+                        cli,
+                        ["backfill", "--start", "2024-01-01", "--end", "2024-01-31"],
+                    )
+
+    @pytest.mark.unit
+    def test_backfill_interrupted_saves_progress(self, runner, temp_db_dir):
+        """An interrupted backfill should record the oldest reading it saved."""
+        db_path = temp_db_dir / "test.duckdb"
+
+        from weather_app.database.engine import WeatherDatabase
+
+        with WeatherDatabase(str(db_path)):
+            pass
+
+        def fetch(mac, batch_callback, **kwargs):
+            batch_callback(
+                [
+                    {"dateutc": 1706000000000, "tempf": 40.0},
+                    {"dateutc": 1705900000000, "tempf": 41.0},
+                ]
+            )
+            raise KeyboardInterrupt
+
+        result = self._run_backfill(runner, db_path, self._backfill_api(fetch))
+
+        assert result.exit_code == 1
+        assert "interrupted" in result.output
+        with WeatherDatabase(str(db_path)) as db:
+            progress = db.get_active_backfill_progress()
+        assert progress["current_date"] == "2024-01-22T05:06:40+00:00"
+        assert progress["total_records"] == 2
+
+    @pytest.mark.unit
+    def test_backfill_saves_progress_periodically(self, runner, temp_db_dir):
+        """Progress should be written during the fetch, throttled by time."""
+        db_path = temp_db_dir / "test.duckdb"
+
+        from weather_app.database.engine import WeatherDatabase
+
+        with WeatherDatabase(str(db_path)):
+            pass
+
+        saved = []
+
+        def fetch(mac, batch_callback, **kwargs):
+            for dateutc in (1706000000000, 1705900000000):
+                batch_callback([{"dateutc": dateutc, "tempf": 40.0}])
+                with WeatherDatabase(str(db_path)) as db:
+                    saved.append(db.get_active_backfill_progress()["current_date"])
+            return 2, 2, 0
+
+        with patch.object(cli_module, "BACKFILL_PROGRESS_SAVE_SECONDS", 0.0):
+            result = self._run_backfill(runner, db_path, self._backfill_api(fetch))
+
+        assert result.exit_code == 0
+        assert saved == ["2024-01-23T08:53:20+00:00", "2024-01-22T05:06:40+00:00"]
+
+    @pytest.mark.unit
+    def test_backfill_throttles_progress_writes(self, runner, temp_db_dir):
+        """Batches within the save interval shouldn't write progress."""
+        db_path = temp_db_dir / "test.duckdb"
+
+        from weather_app.database.engine import WeatherDatabase
+
+        with WeatherDatabase(str(db_path)):
+            pass
+
+        saved = []
+
+        def fetch(mac, batch_callback, **kwargs):
+            batch_callback([{"dateutc": 1706000000000, "tempf": 40.0}])
+            with WeatherDatabase(str(db_path)) as db:
+                saved.append(db.get_active_backfill_progress()["current_date"])
+            return 1, 1, 0
+
+        result = self._run_backfill(runner, db_path, self._backfill_api(fetch))
+
+        assert result.exit_code == 0
+        assert saved == ["2024-01-31"]
+
+    @pytest.mark.unit
+    def test_backfill_resumes_interrupted_range(self, runner, temp_db_dir):
+        """A rerun of the same range should continue where the last one stopped."""
+        db_path = temp_db_dir / "test.duckdb"
+
+        from weather_app.database.engine import WeatherDatabase
+
+        with WeatherDatabase(str(db_path)) as db:
+            progress_id = db.init_backfill_progress("2024-01-01", "2024-01-31")
+            db.update_backfill_progress(
+                progress_id,
+                current_date="2024-01-22T05:06:40+00:00",
+                total_records=2,
+            )
+
+        fetch_ends = []
+
+        def fetch(mac, end_date, batch_callback, **kwargs):
+            fetch_ends.append(end_date)
+            batch_callback([{"dateutc": 1704100000000, "tempf": 30.0}])
+            return 1, 1, 0
+
+        result = self._run_backfill(runner, db_path, self._backfill_api(fetch))
+
+        assert result.exit_code == 0
+        assert "Resuming interrupted backfill" in result.output
+        assert fetch_ends[0].timestamp() == 1705900000
+        with WeatherDatabase(str(db_path)) as db:
+            progress = db.get_backfill_progress(progress_id)
+            assert db.get_active_backfill_progress() is None
+        assert progress["status"] == "completed"
+        assert progress["total_records"] == 3
+
 
 # =============================================================================
 # EXPORT COMMAND ADDITIONAL TESTS
@@ -8,13 +8,15 @@ Tests cover:
 - Edge cases and error handling
 """
 
+import subprocess
+import sys
 import tempfile
 from datetime import datetime
 from pathlib import Path
 
 import pytest
 
-from weather_app.database.engine import WeatherDatabase
+from weather_app.database.engine import WeatherDatabase, data_version
 
 # =============================================================================
 # FIXTURES
@@ -41,6 +43,14 @@ def temp_db():
     wal_path.unlink(missing_ok=True)
 
 
+def _run_duckdb(db_path: str, sql: str) -> subprocess.CompletedProcess:
+    """Run a statement against a database file from a separate process."""
+    script = "import duckdb, sys; duckdb.connect(sys.argv[1]).execute(sys.argv[2])"
+    return subprocess.run(
+        [sys.executable, "-c", script, db_path, sql], capture_output=True, text=True
+    )
+
+
 @pytest.fixture
 def sample_record():
     """Single weather data record."""
@@ -109,6 +119,46 @@ class TestWeatherDatabaseContextManager:
             pass
         assert db.conn is None
 
+    @pytest.mark.unit
+    def test_file_unlocked_after_last_context(self, temp_db):
+        """Another process should be able to open the file once contexts exit."""
+        with WeatherDatabase(temp_db):
+            pass
+
+        # DuckDB allows one read-write process per file, so this fails while
+        # this process still holds a connection
+        result = _run_duckdb(temp_db, "SELECT 1")
+        assert result.returncode == 0, result.stderr
+
+    @pytest.mark.unit
+    def test_overlapping_contexts_share_connection(self, temp_db, sample_record):
+        """An inner context exiting shouldn't close the outer one's connection."""
+        with WeatherDatabase(temp_db) as outer:
+            with WeatherDatabase(temp_db) as inner:
+                inner.insert_data(sample_record)
+            count = outer.conn.execute("SELECT COUNT(*) FROM weather_data").fetchone()
+            assert count[0] == 1
+
+    @pytest.mark.unit
+    def test_data_version_tracks_other_processes(self, temp_db):
+        """Reopening keeps the data version unless the file changed meanwhile."""
+        with WeatherDatabase(temp_db):
+            pass
+        version = data_version(temp_db)
+
+        with WeatherDatabase(temp_db):
+            pass
+        assert data_version(temp_db) == version
+
+        result = _run_duckdb(
+            temp_db, "INSERT INTO weather_data (dateutc) VALUES (1704110400000)"
+        )
+        assert result.returncode == 0, result.stderr
+
+        with WeatherDatabase(temp_db):
+            pass
+        assert data_version(temp_db) != version
+
     @pytest.mark.unit
     def test_context_manager_creates_tables(self, temp_db):
         """Tables should be created automatically on context entry."""
@@ -124,16 +174,112 @@ class TestWeatherDatabaseContextManager:
             assert "backfill_progress" in table_names
 
     @pytest.mark.unit
-    def test_context_manager_creates_indexes(self, temp_db):
-        """Indexes should be created for common queries."""
+    def test_raw_json_column_is_json(self, temp_db, sample_record):
+        """raw_json should be stored as native JSON and queryable."""
+        with WeatherDatabase(temp_db) as db:
+            db.insert_data(dict(sample_record, raw_json='{"tempf": 72.5}'))
+            result = db.conn.execute(
+                "SELECT typeof(raw_json), raw_json->>'tempf' FROM weather_data"
+            ).fetchone()
+            assert result == ("JSON", "72.5")
+
+    @pytest.mark.unit
+    def test_context_manager_creates_no_secondary_indexes(self, temp_db):
+        """weather_data should be indexed only by its dateutc primary key."""
+        with WeatherDatabase(temp_db) as db:
+            indexes = db.conn.execute(
+                "SELECT index_name FROM duckdb_indexes() WHERE table_name = 'weather_data'"
+            ).fetchall()
+            assert indexes == []
+
+    @pytest.mark.unit
+    def test_context_manager_drops_legacy_indexes(self, temp_db):
+        """Indexes from older databases should be dropped."""
+        with WeatherDatabase(temp_db) as db:
+            db.conn.execute("CREATE INDEX idx_dateutc ON weather_data(dateutc)")
+            db.conn.execute("CREATE INDEX idx_date ON weather_data(date)")
+            db.conn.execute(
+                "CREATE INDEX idx_date_dateutc ON weather_data(date, dateutc)"
+            )
+        WeatherDatabase.close_shared(temp_db)
+
         with WeatherDatabase(temp_db) as db:
-            # Check indexes exist (DuckDB specific query)
             indexes = db.conn.execute(
                 "SELECT index_name FROM duckdb_indexes() WHERE table_name = 'weather_data'"
             ).fetchall()
-            index_names = [idx[0] for idx in indexes]
-            assert "idx_dateutc" in index_names
-            assert "idx_date" in index_names
+            assert indexes == []
+
+    @pytest.mark.unit
+    def test_context_migrates_id_keyed_table(self, temp_db):
+        """Tables from before dateutc became the key should be rebuilt in place."""
+        import duckdb
+
+        conn = duckdb.connect(temp_db)
+        conn.execute("CREATE SEQUENCE weather_data_id_seq START 1")
+        conn.execute("""
+            CREATE TABLE weather_data (
+                id INTEGER PRIMARY KEY DEFAULT nextval('weather_data_id_seq'),
+                dateutc BIGINT UNIQUE NOT NULL,
+                date VARCHAR,
+                tempf DOUBLE,
+                raw_json VARCHAR
+            )
+        """)
+        conn.execute("""
+            INSERT INTO weather_data (dateutc, date, tempf, raw_json)
+            VALUES (1704067200000, '2024-01-01T00:00:00', 45.2, '{"tempf": 45.2}')
+        """)
+        conn.close()
+
+        with WeatherDatabase(temp_db) as db:
+            columns = [
+                row[0] for row in db.conn.execute("DESCRIBE weather_data").fetchall()
+            ]
+            assert "id" not in columns
+            constraints = db.conn.execute("""
+                SELECT constraint_column_names FROM duckdb_constraints()
+                WHERE table_name = 'weather_data' AND constraint_type = 'PRIMARY KEY'
+            """).fetchall()
+            assert constraints == [(["dateutc"],)]
+
+            records = db.get_data()
+            assert len(records) == 1
+            assert records[0]["tempf"] == 45.2
+            assert db.get_summary()["total_records"] == 1
+
+    @pytest.mark.unit
+    def test_contexts_share_one_connection(self, temp_db, sample_record):
+        """Later contexts should reuse the database opened by the first one."""
+        with WeatherDatabase(temp_db) as db:
+            db.insert_data(sample_record)
+
+        with WeatherDatabase(temp_db) as db:
+            tables = db.conn.execute(
+                "SELECT COUNT(*) FROM duckdb_tables() WHERE table_name = 'weather_data'"
+            ).fetchone()
+            assert tables[0] == 1
+            assert len(db.get_data()) == 1
+
+    @pytest.mark.unit
+    def test_context_reopens_deleted_database(self, temp_db, sample_record):
+        """A database file removed on disk should be recreated, not reused."""
+        with WeatherDatabase(temp_db) as db:
+            db.insert_data(sample_record)
+
+        Path(temp_db).unlink()
+
+        with WeatherDatabase(temp_db) as db:
+            assert db.get_data() == []
+        assert Path(temp_db).exists()
+
+    @pytest.mark.unit
+    def test_context_applies_engine_settings(self, temp_db):
+        """Opening a database should apply the configured DuckDB settings."""
+        from weather_app.config import DUCKDB_THREADS
+
+        with WeatherDatabase(temp_db) as db:
+            threads = db.conn.execute("SELECT current_setting('threads')").fetchone()
+            assert threads[0] == DUCKDB_THREADS
 
     @pytest.mark.unit
     def test_connection_closes_on_exception(self, temp_db):
@@ -199,6 +345,79 @@ class TestWeatherDatabaseInsert:
             result = db.get_data(limit=1)
             assert result[0]["tempf"] == 80.0
 
+    @pytest.mark.unit
+    def test_insert_duplicate_keeps_unspecified_columns(self, temp_db, sample_record):
+        """Updating a record should only overwrite the columns it provides."""
+        with WeatherDatabase(temp_db) as db:
+            db.insert_data(sample_record)
+            db.insert_data({"dateutc": sample_record["dateutc"], "tempf": 80.0})
+
+            result = db.get_data()
+            assert len(result) == 1
+            assert result[0]["tempf"] == 80.0
+            assert result[0]["humidity"] == sample_record["humidity"]
+            assert db.get_summary()["total_records"] == 1
+
+    @pytest.mark.unit
+    def test_insert_duplicate_explicit_none_clears_column(self, temp_db, sample_record):
+        """A key set to None should overwrite the stored value with NULL."""
+        with WeatherDatabase(temp_db) as db:
+            db.insert_data(sample_record)
+            db.insert_data({"dateutc": sample_record["dateutc"], "tempf": None})
+
+            result = db.get_data()
+            assert result[0]["tempf"] is None
+            assert result[0]["humidity"] == sample_record["humidity"]
+
+    @pytest.mark.unit
+    def test_insert_dateutc_only_record(self, temp_db, sample_record):
+        """A record with nothing but its key should leave a stored row alone."""
+        with WeatherDatabase(temp_db) as db:
+            db.insert_data(sample_record)
+            inserted, skipped = db.insert_data({"dateutc": sample_record["dateutc"]})
+
+            assert (inserted, skipped) == (1, 0)
+            assert db.get_data()[0]["tempf"] == sample_record["tempf"]
+
+    @pytest.mark.unit
+    def test_insert_batch_with_mixed_columns(self, temp_db, sample_records):
+        """Records with different keys in one batch should each keep their own."""
+        with WeatherDatabase(temp_db) as db:
+            db.insert_data(sample_records)
+            first, second = sample_records[0], sample_records[1]
+            inserted, skipped = db.insert_data(
+                [
+                    {"dateutc": first["dateutc"], "tempf": None},
+                    {"dateutc": second["dateutc"], "humidity": 99},
+                ]
+            )
+            assert (inserted, skipped) == (2, 0)
+
+            rows = {r["dateutc"]: r for r in db.get_data()}
+            assert rows[first["dateutc"]]["tempf"] is None
+            assert rows[first["dateutc"]]["humidity"] == first["humidity"]
+            assert rows[second["dateutc"]]["humidity"] == 99
+            assert rows[second["dateutc"]]["tempf"] == second["tempf"]
+            assert db.get_summary()["total_records"] == len(sample_records)
+
+    @pytest.mark.unit
+    def test_insert_string_dateutc(self, temp_db, sample_record):
+        """A numeric string dateutc should be stored as the same BIGINT key."""
+        with WeatherDatabase(temp_db) as db:
+            inserted, skipped = db.insert_data(
+                {"dateutc": str(sample_record["dateutc"]), "tempf": 1.0}
+            )
+            assert (inserted, skipped) == (1, 0)
+
+            inserted, skipped = db.insert_data(sample_record)
+            assert (inserted, skipped) == (1, 0)
+
+            result = db.get_data()
+            assert len(result) == 1
+            assert result[0]["dateutc"] == sample_record["dateutc"]
+            assert result[0]["tempf"] == sample_record["tempf"]
+            assert db.get_summary()["total_records"] == 1
+
     @pytest.mark.unit
     def test_insert_record_without_dateutc_skipped(self, temp_db):
         """Records without dateutc should be skipped."""
@@ -220,6 +439,101 @@ class TestWeatherDatabaseInsert:
             assert inserted == 1
             assert skipped == 0
 
+    @pytest.mark.unit
+    def test_insert_spans_multiple_chunks(self, temp_db):
+        """Batches larger than one chunk should be written in full."""
+        base = 1704067200000  # 2024-01-01 00:00:00 UTC
+        records = [
+            {
+                "dateutc": base + i * 60000,
+                "date": f"2024-01-01T{i // 60 % 24:02d}:{i % 60:02d}:00",
+            }
+            for i in range(2500)
+        ]
+        with WeatherDatabase(temp_db) as db:
+            inserted, skipped = db.insert_data(records)
+            assert inserted == 2500
+            assert skipped == 0
+            assert db.get_summary()["total_records"] == 2500
+
+    @pytest.mark.unit
+    def test_insert_duplicate_within_batch_keeps_last(self, temp_db, sample_record):
+        """A repeated dateutc within one batch should keep the later values."""
+        updated_record = sample_record.copy()
+        updated_record["tempf"] = 80.0
+        with WeatherDatabase(temp_db) as db:
+            inserted, skipped = db.insert_data([sample_record, updated_record])
+            assert inserted == 2
+            assert skipped == 0
+
+            result = db.get_data()
+            assert len(result) == 1
+            assert result[0]["tempf"] == 80.0
+            assert db.get_summary()["total_records"] == 1
+
+    @pytest.mark.unit
+    def test_insert_bad_record_only_skips_itself(self, temp_db, sample_records):
+        """A record the database rejects shouldn't drop the rest of the batch."""
+        bad_record = {"dateutc": 1704117600000, "tempf": "not a number"}
+        with WeatherDatabase(temp_db) as db:
+            inserted, skipped = db.insert_data(sample_records + [bad_record])
+            assert inserted == 3
+            assert skipped == 1
+            assert len(db.get_data()) == 3
+            assert db.get_summary()["total_records"] == 3
+
+    @pytest.mark.unit
+    def test_insert_large_batch_with_bad_record(self, temp_db):
+        """A bad record in a large batch should only skip itself."""
+        base = 1704067200000  # 2024-01-01 00:00:00 UTC
+        records = [
+            {"dateutc": base + i * 60000, "tempf": 70.0, "humidity": 50}
+            for i in range(300)
+        ]
+        records[150]["tempf"] = "not a number"
+        with WeatherDatabase(temp_db) as db:
+            inserted, skipped = db.insert_data(records)
+            assert inserted == 299
+            assert skipped == 1
+            assert db.get_summary()["total_records"] == 299
+
+    @pytest.mark.unit
+    def test_insert_only_skips_existing_records(self, temp_db, sample_records):
+        """insert_only mode should leave existing rows untouched."""
+        with WeatherDatabase(temp_db) as db:
+            db.insert_data(sample_records[:2])
+
+            changed = [dict(r, tempf=99.0) for r in sample_records]
+            inserted, skipped = db.insert_data(changed, mode="insert_only")
+            assert inserted == 1
+            assert skipped == 2
+
+            result = db.get_data(order_by="dateutc ASC")
+            assert [r["tempf"] for r in result] == [70.0, 72.5, 99.0]
+            assert db.get_summary()["total_records"] == 3
+
+    @pytest.mark.unit
+    def test_insert_replace_overwrites_all_columns(self, temp_db, sample_record):
+        """replace mode should clear columns the new record doesn't provide."""
+        with WeatherDatabase(temp_db) as db:
+            db.insert_data(sample_record)
+            inserted, skipped = db.insert_data(
+                {"dateutc": sample_record["dateutc"], "tempf": 80.0}, mode="replace"
+            )
+            assert inserted == 1
+            assert skipped == 0
+
+            result = db.get_data()
+            assert result[0]["tempf"] == 80.0
+            assert result[0]["humidity"] is None
+
+    @pytest.mark.unit
+    def test_insert_invalid_mode_raises(self, temp_db, sample_record):
+        """Should raise ValueError for an unknown mode."""
+        with WeatherDatabase(temp_db) as db:
+            with pytest.raises(ValueError):
+                db.insert_data(sample_record, mode="merge")
+
     @pytest.mark.unit
     def test_insert_invalid_type_raises(self, temp_db):
         """Should raise TypeError for invalid data types."""
@@ -264,6 +578,21 @@ class TestWeatherDatabaseGetData:
             assert len(result) == 1
             assert result[0]["date"] == "2024-01-01T12:00:00"
 
+    @pytest.mark.unit
+    def test_get_data_invalid_date_raises(self, temp_db):
+        """Should reject date bounds that aren't ISO dates."""
+        with WeatherDatabase(temp_db) as db:
+            with pytest.raises(ValueError):
+                db.get_data(start_date="01/02/2024")
+
+    @pytest.mark.unit
+    def test_get_data_end_date_covers_whole_day(self, temp_db, sample_records):
+        """A bare end date should include every reading on that day."""
+        with WeatherDatabase(temp_db) as db:
+            db.insert_data(sample_records)
+            assert len(db.get_data(end_date="2024-01-01")) == 3
+            assert len(db.get_data(end_date="2024-01-01T12:00:00")) == 2
+
     @pytest.mark.unit
     def test_get_data_empty_database(self, temp_db):
         """Should return empty list for empty database."""
@@ -326,6 +655,40 @@ class TestWeatherDatabaseStats:
             assert stats["max_date"] is None
             assert stats["avg_temperature"] is None
 
+    @pytest.mark.unit
+    def test_get_summary_tracks_inserts(self, temp_db, sample_records):
+        """Summary row should follow inserts without counting updates twice."""
+        with WeatherDatabase(temp_db) as db:
+            db.insert_data(sample_records)
+            db.insert_data(sample_records[0])  # Duplicate dateutc - update only
+            summary = db.get_summary()
+
+            assert summary["total_records"] == 3
+            assert summary["min_date"] == "2024-01-01T11:00:00"
+            assert summary["max_date"] == "2024-01-01T13:00:00"
+
+    @pytest.mark.unit
+    def test_get_summary_empty_database(self, temp_db):
+        """Summary should report zero rows for an empty database."""
+        with WeatherDatabase(temp_db) as db:
+            summary = db.get_summary()
+
+            assert summary["total_records"] == 0
+            assert summary["min_date"] is None
+            assert summary["max_date"] is None
+
+    @pytest.mark.unit
+    def test_refresh_stats_resyncs_summary(self, temp_db, sample_records):
+        """refresh_stats should rebuild the summary after writes outside insert_data."""
+        with WeatherDatabase(temp_db) as db:
+            db.insert_data(sample_records)
+            db.conn.execute("DELETE FROM weather_data WHERE dateutc = 1704114000000")
+            db.refresh_stats()
+            summary = db.get_summary()
+
+            assert summary["total_records"] == 2
+            assert summary["max_date"] == "2024-01-01T12:00:00"
+
 
 # =============================================================================
 # WeatherDatabase TESTS - Backfill Progress
@@ -343,6 +706,16 @@ class TestWeatherDatabaseBackfill:
             assert progress_id is not None
             assert progress_id > 0
 
+    @pytest.mark.unit
+    def test_init_backfill_progress_returns_own_id(self, temp_db):
+        """Each record should get back the id of its own row."""
+        with WeatherDatabase(temp_db) as db:
+            first_id = db.init_backfill_progress("2024-01-01", "2024-01-31")
+            second_id = db.init_backfill_progress("2024-02-01", "2024-02-29")
+            assert first_id != second_id
+            assert db.get_backfill_progress(first_id)["start_date"] == "2024-01-01"
+            assert db.get_backfill_progress(second_id)["start_date"] == "2024-02-01"
+
     @pytest.mark.unit
     def test_get_backfill_progress(self, temp_db):
         """Should retrieve backfill progress record."""
@@ -373,6 +746,25 @@ class TestWeatherDatabaseBackfill:
             assert progress["total_records"] == 1000
             assert progress["skipped_records"] == 50
 
+    @pytest.mark.unit
+    def test_get_active_backfill_progress(self, temp_db):
+        """Should return the latest backfill still in progress."""
+        with WeatherDatabase(temp_db) as db:
+            assert db.get_active_backfill_progress() is None
+
+            finished_id = db.init_backfill_progress("2024-01-01", "2024-01-31")
+            active_id = db.init_backfill_progress("2024-02-01", "2024-02-29")
+            db.update_backfill_progress(
+                finished_id,
+                current_date="2024-01-31",
+                total_records=100,
+                skipped_records=0,
+                status="completed",
+            )
+
+            progress = db.get_active_backfill_progress()
+            assert progress["id"] == active_id
+
     @pytest.mark.unit
     def test_clear_backfill_progress(self, temp_db):
         """Should delete backfill progress record."""
@@ -314,6 +314,60 @@ class TestGetAllReadings:
         assert len(results) == 2
         # After skipping 2, should get the 3rd and 4th records (by date desc)
 
+    @pytest.mark.unit
+    def test_get_all_readings_range_past_data(self, populated_db_path):
+        """A range after the last reading is empty until data arrives there."""
+        with patch("weather_app.database.repository.DB_PATH", populated_db_path):
+            before = WeatherRepository.get_all_readings(start_date="2024-01-04")
+
+            with WeatherDatabase(populated_db_path) as db:
+                db.insert_data(
+                    {
+                        "dateutc": 1704373200000,
+                        "date": "2024-01-04T13:00:00",
+                        "tempf": 60.0,
+                    }
+                )
+
+            after = WeatherRepository.get_all_readings(start_date="2024-01-04")
+
+        assert before == []
+        assert [r["date"] for r in after] == ["2024-01-04T13:00:00"]
+
+    @pytest.mark.unit
+    def test_get_all_readings_with_cursor(self, populated_db_path):
+        """A cursor should continue from the previous page in either order."""
+        with patch("weather_app.database.repository.DB_PATH", populated_db_path):
+            desc_page = WeatherRepository.get_all_readings(limit=2)
+            desc_next = WeatherRepository.get_all_readings(
+                limit=2, cursor=desc_page[-1]["dateutc"]
+            )
+            asc_page = WeatherRepository.get_all_readings(limit=2, order="asc")
+            asc_next = WeatherRepository.get_all_readings(
+                limit=2, order="asc", cursor=asc_page[-1]["dateutc"]
+            )
+            by_offset = WeatherRepository.get_all_readings(limit=2, offset=2)
+
+        assert desc_next == by_offset
+        assert [r["date"] for r in asc_next] == [
+            "2024-01-01T13:00:00",
+            "2024-01-02T13:00:00",
+        ]
+
+    @pytest.mark.unit
+    def test_get_all_readings_rejects_cursor_with_offset(self, populated_db_path):
+        """A cursor with a nonzero offset should be rejected, not skip rows."""
+        with patch("weather_app.database.repository.DB_PATH", populated_db_path):
+            first = WeatherRepository.get_all_readings(limit=1)
+            with pytest.raises(ValueError, match="cursor"):
+                WeatherRepository.get_all_readings(
+                    limit=2, offset=1, cursor=first[0]["dateutc"]
+                )
+            # offset=0 is the default, so it is allowed alongside a cursor
+            assert WeatherRepository.get_all_readings(
+                limit=2, offset=0, cursor=first[0]["dateutc"]
+            ) == WeatherRepository.get_all_readings(limit=2, offset=1)
+
     @pytest.mark.unit
     def test_get_all_readings_order_asc(self, populated_db_path):
         """Should order by date ascending."""
@@ -365,6 +419,29 @@ class TestGetAllReadings:
         # Should include: 12:00, 13:00 on Jan 1, and 13:00 on Jan 2
         assert len(results) == 3
 
+    @pytest.mark.unit
+    def test_get_all_readings_end_date_includes_whole_day(self, populated_db_path):
+        """A bare end date should include every reading on that day."""
+        with patch("weather_app.database.repository.DB_PATH", populated_db_path):
+            results = WeatherRepository.get_all_readings(
+                start_date="2024-01-01", end_date="2024-01-01"
+            )
+
+        # Should include all three Jan 1 records
+        assert len(results) == 3
+
+    @pytest.mark.unit
+    def test_get_all_readings_with_offset_dates(self, populated_db_path):
+        """Date bounds with a UTC offset should be compared in UTC."""
+        with patch("weather_app.database.repository.DB_PATH", populated_db_path):
+            # 2024-01-01T20:00:00+08:00 is 2024-01-01T12:00:00 UTC
+            results = WeatherRepository.get_all_readings(
+                start_date="2024-01-01T20:00:00+08:00"
+            )
+
+        # Should include everything from 12:00 UTC on Jan 1
+        assert len(results) == 4
+
     @pytest.mark.unit
     def test_get_all_readings_invalid_start_date(self, populated_db_path):
         """Should raise ValueError for invalid start date format."""
@@ -383,6 +460,15 @@ class TestGetAllReadings:
 
         assert "Invalid end_date format" in str(exc_info.value)
 
+    @pytest.mark.unit
+    def test_get_all_readings_invalid_order(self, populated_db_path):
+        """Should reject sort orders other than asc/desc."""
+        with patch("weather_app.database.repository.DB_PATH", populated_db_path):
+            with pytest.raises(ValueError) as exc_info:
+                WeatherRepository.get_all_readings(order="asc; DROP TABLE weather_data")
+
+        assert "Invalid order" in str(exc_info.value)
+
     @pytest.mark.unit
     def test_get_all_readings_empty_database(self, temp_db_path):
         """Should return empty list for empty database."""
@@ -442,6 +528,97 @@ class TestGetLatestReading:
         assert "dateutc" in result
         assert "tempf" in result
 
+    @pytest.mark.unit
+    def test_get_latest_reading_leaves_out_raw_json(self, temp_db_path):
+        """Reads shouldn't return the stored API payload."""
+        with WeatherDatabase(temp_db_path) as db:
+            db.insert_data(
+                {
+                    "dateutc": 1704110400000,
+                    "date": "2024-01-01T12:00:00",
+                    "tempf": 72.5,
+                    "raw_json": '{"tempf": 72.5}',
+                }
+            )
+
+        with patch("weather_app.database.repository.DB_PATH", temp_db_path):
+            result = WeatherRepository.get_latest_reading()
+
+        assert result["tempf"] == 72.5
+        assert "raw_json" not in result
+
+
+# =============================================================================
+# READ CACHE TESTS
+# =============================================================================
+
+
+class TestReadCache:
+    """Tests for the short-lived cache of repository read results."""
+
+    @pytest.mark.unit
+    def test_repeat_reads_served_from_cache(self, populated_db_path):
+        """Identical reads shouldn't query the database again."""
+        with patch("weather_app.database.repository.DB_PATH", populated_db_path):
+            first = WeatherRepository.get_all_readings(limit=2)
+
+            # Change data behind the repository's back, without insert_data
+            with WeatherDatabase(populated_db_path) as db:
+                db.conn.execute("DELETE FROM weather_data")
+
+            assert WeatherRepository.get_all_readings(limit=2) == first
+            assert WeatherRepository.get_all_readings(limit=3) == []
+
+    @pytest.mark.unit
+    def test_insert_invalidates_cache(self, populated_db_path):
+        """Writes through WeatherDatabase should be visible immediately."""
+        with patch("weather_app.database.repository.DB_PATH", populated_db_path):
+            before = WeatherRepository.get_latest_reading()
+
+            with WeatherDatabase(populated_db_path) as db:
+                db.insert_data(
+                    {
+                        "dateutc": 1704373200000,
+                        "date": "2024-01-04T13:00:00",
+                        "tempf": 60.0,
+                    }
+                )
+
+            after = WeatherRepository.get_latest_reading()
+
+        assert before["tempf"] == 65.0
+        assert after["tempf"] == 60.0
+
+    @pytest.mark.unit
+    def test_mutating_result_does_not_change_cache(self, populated_db_path):
+        """Changing a returned result shouldn't affect later cached reads."""
+        with patch("weather_app.database.repository.DB_PATH", populated_db_path):
+            readings = WeatherRepository.get_all_readings(limit=2)
+            expected = [dict(r) for r in readings]
+            readings[0]["tempf"] = -999.0
+            readings.append({"dateutc": 0})
+
+            latest = WeatherRepository.get_latest_reading()
+            latest["tempf"] = -999.0
+            stats = WeatherRepository.get_stats()
+            stats["total_records"] = -1
+
+            assert WeatherRepository.get_all_readings(limit=2) == expected
+            assert WeatherRepository.get_latest_reading()["tempf"] == 65.0
+            assert WeatherRepository.get_stats()["total_records"] == 5
+
+    @pytest.mark.unit
+    def test_clear_cache(self, populated_db_path):
+        """clear_cache should force the next read to hit the database."""
+        with patch("weather_app.database.repository.DB_PATH", populated_db_path):
+            WeatherRepository.get_latest_reading()
+
+            with WeatherDatabase(populated_db_path) as db:
+                db.conn.execute("DELETE FROM weather_data")
+
+            WeatherRepository.clear_cache()
+            assert WeatherRepository.get_latest_reading() is None
+
 
 # =============================================================================
 # GET_STATS TESTS
@@ -503,6 +680,28 @@ class TestGetStats:
         for key in expected_keys:
             assert key in stats
 
+    @pytest.mark.unit
+    def test_get_stats_refreshed_after_insert(self, populated_db_path):
+        """Cached stats should be invalidated when new rows are inserted."""
+        with patch("weather_app.database.repository.DB_PATH", populated_db_path):
+            before = WeatherRepository.get_stats()
+
+            with WeatherDatabase(populated_db_path) as db:
+                db.insert_data(
+                    {
+                        "dateutc": 1704373200000,
+                        "date": "2024-01-04T13:00:00",
+                        "tempf": 60.0,
+                    }
+                )
+
+            after = WeatherRepository.get_stats()
+
+        assert before["total_records"] == 5
+        assert after["total_records"] == 6
+        assert after["max_date"] == "2024-01-04T13:00:00"
+        assert after["date_range_days"] == 3
+
 
 # =============================================================================
 # ERROR HANDLING TESTS
@@ -2,11 +2,10 @@
 Command-line interface for Weather App
 """
 
-import csv
 import os
 import sys
 import time
-from datetime import datetime
+from datetime import UTC, datetime
 from pathlib import Path
 
 import click
@@ -16,9 +15,7 @@ from dotenv import load_dotenv
 if sys.platform == "win32" and hasattr(sys.stdout, "reconfigure"):
     sys.stdout.reconfigure(encoding="utf-8")
 
-from weather_app.api import AmbientWeatherAPI
 from weather_app.config import DB_PATH, get_db_info
-from weather_app.database import WeatherDatabase
 from weather_app.logging_config import get_logger, log_cli_command
 
 # Load environment variables from .env file
@@ -27,6 +24,10 @@ load_dotenv()
 # Initialize logger
 logger = get_logger(__name__)
 
+# Minimum seconds between backfill progress writes, so a long backfill keeps
+# a recent resume point without a database write for every batch
+BACKFILL_PROGRESS_SAVE_SECONDS = 30.0
+
 
 @click.group()
 @click.version_option(version="1.0.0", prog_name="weather-app")
@@ -39,6 +40,8 @@ def cli():
 @click.option("--force", is_flag=True, help="Drop existing tables and recreate")
 def init_db(force):
     """Initialize the weather database"""
+    from weather_app.database import WeatherDatabase
+
     start_time = time.time()
     db_path = Path(DB_PATH)
 
@@ -90,6 +93,9 @@ def init_db(force):
 )
 def fetch(limit):
     """Fetch latest weather data from Ambient Weather API"""
+    from weather_app.api import AmbientWeatherAPI
+    from weather_app.database import WeatherDatabase
+
     start_time = time.time()
 
     # Get API credentials from environment
@@ -190,6 +196,9 @@ def fetch(limit):
 )
 def backfill(start, end, batch_size, delay):
     """Backfill historical weather data for a date range"""
+    from weather_app.api import AmbientWeatherAPI
+    from weather_app.database import WeatherDatabase
+
     start_time = time.time()
 
     # Validate dates
@@ -262,8 +271,51 @@ def backfill(start, end, batch_size, delay):
 
             # Fetch and save data incrementally
             with WeatherDatabase(str(db_path)) as db:
-                # Initialize backfill progress
-                progress_id = db.init_backfill_progress(start, end)
+                # Resume an interrupted backfill of the same range from the
+                # oldest reading it saved; otherwise start a new one. Backfills
+                # page backward from the end date, so current_date is the
+                # point reached so far.
+                active = db.get_active_backfill_progress()
+                if active and (active["start_date"], active["end_date"]) == (
+                    start,
+                    end,
+                ):
+                    progress_id = active["id"]
+                    fetch_end = datetime.fromisoformat(active["current_date"])
+                    prior_fetched = active["total_records"]
+                    prior_skipped = active["skipped_records"]
+                    logger.info(
+                        "backfill_resumed",
+                        progress_id=progress_id,
+                        current_date=active["current_date"],
+                    )
+                    click.echo(
+                        f"Resuming interrupted backfill from {active['current_date']}\n"
+                    )
+                else:
+                    progress_id = db.init_backfill_progress(start, end)
+                    fetch_end = end_date
+                    prior_fetched = prior_skipped = 0
+
+                # Oldest saved reading and running totals, recorded every
+                # BACKFILL_PROGRESS_SAVE_SECONDS and if the backfill stops
+                # early, so the next run can resume from there
+                oldest_saved = None
+                fetched = skipped_total = 0
+                last_saved_at = time.monotonic()
+
+                def save_progress():
+                    if oldest_saved is None:
+                        return
+                    db.update_backfill_progress(
+                        progress_id=progress_id,
+                        current_date=datetime.fromtimestamp(
+                            oldest_saved / 1000, UTC
+                        ).isoformat(),
+                        total_records=prior_fetched + fetched,
+                        skipped_records=prior_skipped + skipped_total,
+                        status="in_progress",
+                    )
 
                 # Progress callback - shows fetch progress
                 def progress_callback(records_fetched, requests_made):
@@ -279,27 +331,49 @@ def backfill(start, end, batch_size, delay):
 
                 # Batch callback - saves each batch immediately to database
                 def batch_callback(batch_data):
-                    inserted, skipped = db.insert_data(batch_data)
+                    nonlocal oldest_saved, fetched, skipped_total, last_saved_at
+                    inserted, skipped = db.insert_data(batch_data, mode="insert_only")
                     logger.debug(
                         "batch_saved",
                         batch_size=len(batch_data),
                         inserted=inserted,
                         skipped=skipped,
                     )
+                    oldest = min(
+                        (d["dateutc"] for d in batch_data if "dateutc" in d),
+                        default=None,
+                    )
+                    if oldest is not None and (
+                        oldest_saved is None or oldest < oldest_saved
+                    ):
+                        oldest_saved = oldest
+                    fetched += len(batch_data)
+                    skipped_total += skipped
+
+                    now = time.monotonic()
+                    if now - last_saved_at >= BACKFILL_PROGRESS_SAVE_SECONDS:
+                        save_progress()
+                        last_saved_at = now
                     return inserted, skipped
 
                 # Fetch data with incremental saving
-                result = api.fetch_all_historical_data(
-                    mac,
-                    start_date=start_date,
-                    end_date=end_date,
-                    batch_size=batch_size,
-                    delay=delay,
-                    progress_callback=progress_callback,
-                    batch_callback=batch_callback,
-                )
+                try:
+                    result = api.fetch_all_historical_data(
+                        mac,
+                        start_date=start_date,
+                        end_date=fetch_end,
+                        batch_size=batch_size,
+                        delay=delay,
+                        progress_callback=progress_callback,
+                        batch_callback=batch_callback,
+                    )
+                except BaseException:
+                    save_progress()
+                    raise
 
                 total_fetched, total_inserted, total_skipped = result
+                total_fetched += prior_fetched
+                total_skipped += prior_skipped
 
                 if total_fetched == 0:
                     logger.info("backfill_completed", records=0, reason="no_data_found")
@@ -354,6 +428,11 @@ def backfill(start, end, batch_size, delay):
 @click.option("--limit", type=int, help="Maximum number of records to export")
 def export(output, start, end, limit):
     """Export weather data to CSV"""
+    import csv
+
+    from weather_app.database import WeatherDatabase
+    from weather_app.database.engine import iso_end_to_dateutc, iso_to_dateutc
+
     db_path = Path(DB_PATH)
 
     if not db_path.exists():
@@ -369,8 +448,8 @@ def export(output, start, end, limit):
     if start:
         try:
             datetime.strptime(start, "%Y-%m-%d")
-            conditions.append("date >= ?")
-            params.append(start)
+            conditions.append("dateutc >= ?")
+            params.append(iso_to_dateutc(start))
         except ValueError:
             click.echo(f"❌ Invalid start date format: {start}")
             sys.exit(1)
@@ -378,8 +457,8 @@ def export(output, start, end, limit):
     if end:
         try:
             datetime.strptime(end, "%Y-%m-%d")
-            conditions.append("date <= ?")
-            params.append(end)
+            conditions.append("dateutc < ?")
+            params.append(iso_end_to_dateutc(end))
         except ValueError:
             click.echo(f"❌ Invalid end date format: {end}")
             sys.exit(1)
@@ -419,9 +498,51 @@ def export(output, start, end, limit):
     click.echo(f"✅ Exported {len(rows)} records to {output_path}")
 
 
+@cli.command("import")
+@click.option(
+    "--csv",
+    "csv_path",
+    required=True,
+    type=click.Path(exists=True, dir_okay=False),
+    help="CSV file to load (e.g. from 'weather-app export')",
+)
+def import_csv(csv_path):
+    """Bulk-load weather data from a CSV file"""
+    from weather_app.database import WeatherDatabase
+
+    start_time = time.time()
+    db_path = Path(DB_PATH)
+
+    if not db_path.exists():
+        click.echo(f"❌ Database not found at {db_path}")
+        click.echo("Run 'weather-app init-db' first")
+        sys.exit(1)
+
+    click.echo(f"Importing weather data from {csv_path}...")
+    try:
+        with WeatherDatabase(str(db_path)) as db:
+            inserted = db.import_csv(csv_path)
+            total = db.get_summary()["total_records"]
+    except Exception as e:
+        logger.error("import_failed", csv_path=csv_path, error=str(e))
+        click.echo(f"❌ Import failed: {e}")
+        sys.exit(1)
+
+    duration_ms = (time.time() - start_time) * 1000
+    logger.info(
+        "import_completed",
+        csv_path=csv_path,
+        records=inserted,
+        duration_ms=round(duration_ms, 2),
+    )
+    click.echo(f"✅ Imported {inserted:,} new records ({total:,} total)")
+
+
 @cli.command()
 def info():
     """Show database and configuration information"""
+    from weather_app.database import WeatherDatabase
+
     db_info = get_db_info()
     db_path = Path(DB_PATH)
 
@@ -436,20 +557,16 @@ def info():
 
     if db_path.exists():
         try:
-            # Use WeatherDatabase to get record count
+            # Read the maintained weather_stats row instead of scanning weather_data
             with WeatherDatabase(str(db_path)) as db:
-                conn = db._get_conn()
-                result = conn.execute("SELECT COUNT(*) FROM weather_data").fetchone()
-                count = result[0] if result else 0
+                summary = db.get_summary()
+                count = summary["total_records"]
                 click.echo(f"Total records: {count:,}")
 
                 if count > 0:
-                    date_result = conn.execute(
-                        "SELECT MIN(date), MAX(date) FROM weather_data"
-                    ).fetchone()
-                    if date_result:
-                        min_date, max_date = date_result
-                        click.echo(f"Date range: {min_date} to {max_date}")
+                    click.echo(
+                        f"Date range: {summary['min_date']} to {summary['max_date']}"
+                    )
 
             logger.info("info_command_completed", total_records=count)
         except Exception as e:
@@ -567,7 +684,13 @@ def demo():
     is_flag=True,
     help="Regenerate database even if it already exists",
 )
-def demo_generate(days, output, start_date, force):
+@click.option(
+    "--seed",
+    type=int,
+    default=None,
+    help="Random seed for reproducible data (default: random)",
+)
+def demo_generate(days, output, start_date, force, seed):
     """Generate Seattle weather data for demo mode"""
     from datetime import timedelta
 
@@ -620,9 +743,10 @@ def demo_generate(days, output, start_date, force):
         db_path=str(db_path),
         days=days,
         start_date=start.isoformat(),
+        seed=seed,
     )
 
-    generator = SeattleWeatherGenerator(db_path)
+    generator = SeattleWeatherGenerator(db_path, seed=seed)
 
     # Use click's progress bar for CLI feedback
     with click.progressbar(
@@ -71,6 +71,14 @@ TEST_DB = str(BASE_DIR / "ambient_weather_test.duckdb")
 # Select the appropriate database
 DB_PATH = TEST_DB if USE_TEST_DB else PRODUCTION_DB
 
+# DuckDB engine settings, applied when a database file is first opened
+# Worker threads for scans and aggregates (get_stats, sampled reads)
+DUCKDB_THREADS = int(os.getenv("DUCKDB_THREADS", 4))
+# Upper bound on DuckDB's buffer memory, e.g. "2GB"
+DUCKDB_MEMORY_LIMIT = os.getenv("DUCKDB_MEMORY_LIMIT", "2GB")
+# WAL size that triggers a checkpoint; larger values batch ingest writes
+DUCKDB_CHECKPOINT_THRESHOLD = os.getenv("DUCKDB_CHECKPOINT_THRESHOLD", "1GB")
+
 # API Configuration
 API_TITLE = "Weather API"
 API_DESCRIPTION = "API for querying Ambient Weather data"
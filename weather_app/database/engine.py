@@ -4,12 +4,238 @@ Provides context manager-based database access with high-performance analytics
 DuckDB is 10-100x faster than SQLite for analytical queries
 """
 
-from datetime import UTC, datetime
+import atexit
+import functools
+import itertools
+import os
+import threading
+from datetime import UTC, datetime, timedelta
+from typing import Literal
 
 import duckdb
 from duckdb import DuckDBPyConnection
 
-from weather_app.config import DB_PATH
+from weather_app.config import (
+    DB_PATH,
+    DUCKDB_CHECKPOINT_THRESHOLD,
+    DUCKDB_MEMORY_LIMIT,
+    DUCKDB_THREADS,
+)
+
+# Maximum rows written per statement in insert_data, so large backfills
+# don't build one unbounded parameter list or DataFrame
+INSERT_CHUNK_SIZE = 1000
+
+# Chunks at least this large are registered as a DataFrame and inserted with
+# INSERT ... SELECT; below it, binding a multi-row VALUES statement is cheaper
+DATAFRAME_MIN_ROWS = 100
+
+
+# Columns of weather_data in table order
+WEATHER_COLUMNS = (
+    "dateutc",
+    "date",
+    "tempf",
+    "humidity",
+    "baromabsin",
+    "baromrelin",
+    "windspeedmph",
+    "winddir",
+    "windgustmph",
+    "maxdailygust",
+    "hourlyrainin",
+    "eventrain",
+    "dailyrainin",
+    "weeklyrainin",
+    "monthlyrainin",
+    "yearlyrainin",
+    "totalrainin",
+    "solarradiation",
+    "uv",
+    "feelsLike",
+    "dewPoint",
+    "feelsLikein",
+    "dewPointin",
+    "lastRain",
+    "tz",
+    "raw_json",
+)
+
+# Column definitions of weather_data, shared by table creation and the
+# migration that rebuilds tables created with the old id key
+_WEATHER_DATA_SCHEMA = """
+    dateutc BIGINT PRIMARY KEY,
+    date VARCHAR,
+    tempf DOUBLE,
+    humidity INTEGER,
+    baromabsin DOUBLE,
+    baromrelin DOUBLE,
+    windspeedmph DOUBLE,
+    winddir INTEGER,
+    windgustmph DOUBLE,
+    maxdailygust DOUBLE,
+    hourlyrainin DOUBLE,
+    eventrain DOUBLE,
+    dailyrainin DOUBLE,
+    weeklyrainin DOUBLE,
+    monthlyrainin DOUBLE,
+    yearlyrainin DOUBLE,
+    totalrainin DOUBLE,
+    solarradiation DOUBLE,
+    uv INTEGER,
+    feelsLike DOUBLE,
+    dewPoint DOUBLE,
+    feelsLikein DOUBLE,
+    dewPointin DOUBLE,
+    lastRain VARCHAR,
+    tz VARCHAR,
+    raw_json JSON
+"""
+
+# One DuckDB connection per database file, shared by the WeatherDatabase
+# contexts open on it; each context works on its own cursor. DuckDB lets only
+# one process hold a file's write lock, so the connection is closed when the
+# last context exits, leaving the file to other processes (e.g. the CLI
+# fetching while the server runs). Only overlapping contexts (nested calls,
+# concurrent requests) share a connection; sequential ones each reconnect.
+_shared_connections: dict[str, DuckDBPyConnection] = {}
+_shared_users: dict[str, int] = {}
+# File signature (see _file_signature) when this process last closed each
+# database. A reopen that finds it unchanged skips the schema DDL and keeps
+# the data version, so read caches survive the close.
+_closed_signatures: dict[str, tuple | None] = {}
+_shared_lock = threading.Lock()
+
+# Data version per database file, changed by every write made through
+# WeatherDatabase in this process, so read caches can tell when their
+# entries are stale. Versions come from one counter, so they never repeat.
+_data_versions: dict[str, int] = {}
+_version_counter = itertools.count(1)
+
+
+def data_version(db_path: str) -> int:
+    """
+    Get the current data version of a database file.
+
+    The value changes whenever weather data is written through
+    WeatherDatabase in this process, or the file has changed since this
+    process last closed it.
+
+    Args:
+        db_path: Path to the DuckDB database file
+
+    Returns:
+        An opaque version number (0 if the file hasn't been opened yet)
+    """
+    return _data_versions.get(os.path.abspath(db_path), 0)
+
+
+def _file_signature(path: str) -> tuple | None:
+    """Size and modification time of a database file and its WAL, or None."""
+    signature = []
+    for file_path in (path, path + ".wal"):
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            if file_path == path:
+                return None
+            signature.append(None)
+        else:
+            signature.append((stat.st_size, stat.st_mtime_ns))
+    return tuple(signature)
+
+
+def _parse_iso_utc(value: str) -> datetime:
+    """Parse an ISO date or datetime, taking values without an offset as UTC."""
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=UTC)
+    return parsed
+
+
+# API requests repeat the same few bounds (dashboard ranges, export days), so
+# the conversions are memoized; invalid values raise and aren't cached
+@functools.lru_cache(maxsize=256)
+def iso_to_dateutc(value: str) -> int:
+    """
+    Convert an ISO date or datetime to a dateutc value.
+
+    Range filters compare the BIGINT dateutc key instead of the VARCHAR date
+    column. Values without an offset are taken as UTC, like the stored date
+    strings.
+
+    Args:
+        value: ISO date or datetime (YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS)
+
+    Returns:
+        Milliseconds since epoch, UTC
+
+    Raises:
+        ValueError: If value is not an ISO date
+    """
+    return int(_parse_iso_utc(value).timestamp() * 1000)
+
+
+@functools.lru_cache(maxsize=256)
+def iso_end_to_dateutc(value: str) -> int:
+    """
+    Convert an ISO end date or datetime to an exclusive dateutc upper bound.
+
+    Range filters are half-open (dateutc >= start AND dateutc < end). A bare
+    date covers that whole day, so its bound is the following midnight; a
+    datetime is included to the millisecond.
+
+    Args:
+        value: ISO date or datetime (YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS)
+
+    Returns:
+        Milliseconds since epoch, UTC, of the first instant past the range
+
+    Raises:
+        ValueError: If value is not an ISO date
+    """
+    parsed = _parse_iso_utc(value)
+    # ISO date-only forms are at most 10 characters; any time part is longer
+    if len(value) <= 10:
+        return int((parsed + timedelta(days=1)).timestamp() * 1000)
+    return int(parsed.timestamp() * 1000) + 1
+
+
+# DuckDB's Python API has no prepared statements, so the insert_data SQL is at
+# least built once per shape instead of re-joining column lists for every chunk.
+# Upserts name only the columns their records have, so shapes vary with the
+# data source; the caches are bounded.
+@functools.lru_cache(maxsize=64)
+def _conflict_action(columns: tuple[str, ...], mode: str) -> str:
+    """ON CONFLICT (dateutc) action for an insert_data mode."""
+    # Only the listed columns are updated, so an upsert leaves the columns its
+    # records don't have as they were
+    updates = ", ".join(f"{c} = EXCLUDED.{c}" for c in columns if c != "dateutc")
+    if mode == "insert_only" or not updates:
+        return "DO NOTHING"
+    return f"DO UPDATE SET {updates}"
+
+
+@functools.lru_cache(maxsize=64)
+def _values_insert_sql(columns: tuple[str, ...], mode: str, row_count: int) -> str:
+    """Multi-row INSERT ... VALUES statement for row_count records."""
+    row_placeholders = "(" + ", ".join("?" for _ in columns) + ")"
+    values = ", ".join([row_placeholders] * row_count)
+    return (
+        f"INSERT INTO weather_data ({', '.join(columns)}) VALUES {values} "
+        f"ON CONFLICT (dateutc) {_conflict_action(columns, mode)} RETURNING dateutc"
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _frame_insert_sql(columns: tuple[str, ...], mode: str) -> str:
+    """INSERT ... SELECT statement reading the registered incoming_weather frame."""
+    column_list = ", ".join(columns)
+    return (
+        f"INSERT INTO weather_data ({column_list}) "
+        f"SELECT {column_list} FROM incoming_weather "
+        f"ON CONFLICT (dateutc) {_conflict_action(columns, mode)} RETURNING dateutc"
+    )
 
 
 class WeatherDatabase:
@@ -27,6 +253,8 @@ class WeatherDatabase:
 
         self.db_path = db_path
         self.conn: DuckDBPyConnection | None = None
+        # Shared connection this context's cursor belongs to
+        self._shared: DuckDBPyConnection | None = None
 
     def _get_conn(self) -> DuckDBPyConnection:
         """Get the database connection, raising an error if not connected."""
@@ -38,18 +266,95 @@ class WeatherDatabase:
 
     def __enter__(self) -> "WeatherDatabase":
         """
-        Enter context manager - establish database connection.
+        Enter context manager - open a cursor on the shared database connection.
+
+        The first context for a database file opens it and applies the engine
+        settings; contexts entered while it's open reuse that connection. The
+        tables are created unless the file is unchanged since this process
+        last closed it.
 
         Returns:
             self: The WeatherDatabase instance
         """
-        self.conn = duckdb.connect(self.db_path)
-        self._create_tables()
+        key = os.path.abspath(self.db_path)
+        with _shared_lock:
+            shared = _shared_connections.get(key)
+            if shared is None:
+                shared = self._open_shared(key)
+
+            self.conn = shared.cursor()
+            self._shared = shared
+            _shared_users[key] = _shared_users.get(key, 0) + 1
         return self
 
+    def _open_shared(self, key: str) -> DuckDBPyConnection:
+        """Open the shared connection for a database file; call with the lock held."""
+        closed = _closed_signatures.pop(key, None)
+        unchanged = closed is not None and closed == _file_signature(key)
+        shared = duckdb.connect(self.db_path)
+        self.conn = shared
+        try:
+            self._configure()
+            if not unchanged:
+                self._create_tables()
+        except Exception:
+            self.conn = None
+            self._close_quietly(shared)
+            raise
+
+        _shared_connections[key] = shared
+        if not unchanged:
+            _data_versions[key] = next(_version_counter)
+        return shared
+
+    def _configure(self) -> None:
+        """Apply the DuckDB thread, memory and checkpoint settings from config."""
+        conn = self._get_conn()
+        conn.execute(f"SET threads = {int(DUCKDB_THREADS)}")
+        conn.execute("SET memory_limit = ?", [DUCKDB_MEMORY_LIMIT])
+        conn.execute("SET checkpoint_threshold = ?", [DUCKDB_CHECKPOINT_THRESHOLD])
+
+    def _mark_changed(self) -> None:
+        """Give this database file a new data version after a write."""
+        _data_versions[os.path.abspath(self.db_path)] = next(_version_counter)
+
+    @staticmethod
+    def _close_quietly(conn: DuckDBPyConnection) -> None:
+        """Close a connection, ignoring errors from an already-broken handle."""
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    @staticmethod
+    def close_shared(db_path: str | None = None) -> None:
+        """
+        Close the shared connection for a database file, or all of them.
+
+        Runs automatically at interpreter exit. Contexts close the connection
+        themselves when the last one exits; call this to close it while
+        contexts are still open, or to make the next context re-run table
+        creation.
+
+        Args:
+            db_path: Database file to close (defaults to every open database)
+        """
+        with _shared_lock:
+            if db_path is None:
+                keys = list(_shared_connections)
+            else:
+                keys = [os.path.abspath(db_path)]
+            for key in keys:
+                _shared_users.pop(key, None)
+                _closed_signatures.pop(key, None)
+                shared = _shared_connections.pop(key, None)
+                if shared is not None:
+                    WeatherDatabase._close_quietly(shared)
+
     def __exit__(self, exc_type, exc_val, exc_tb):
         """
-        Exit context manager - close database connection.
+        Exit context manager - close this context's cursor, and the shared
+        connection if this was the last context using it.
 
         Args:
             exc_type: Exception type if any
@@ -59,51 +364,57 @@ class WeatherDatabase:
         if self.conn:
             self.conn.close()
         self.conn = None
+
+        key = os.path.abspath(self.db_path)
+        with _shared_lock:
+            # A connection closed by close_shared has no users left to count
+            if (
+                self._shared is not None
+                and _shared_connections.get(key) is self._shared
+            ):
+                users = _shared_users.get(key, 0) - 1
+                if users > 0:
+                    _shared_users[key] = users
+                else:
+                    del _shared_connections[key]
+                    _shared_users.pop(key, None)
+                    self._close_quietly(self._shared)
+                    _closed_signatures[key] = _file_signature(key)
+            self._shared = None
         return False
 
     def _create_tables(self) -> None:
         """Create weather_data and backfill_progress tables if they don't exist."""
         conn = self._get_conn()
-        # Create sequence for weather_data IDs (DuckDB requires explicit sequences)
-        conn.execute("CREATE SEQUENCE IF NOT EXISTS weather_data_id_seq START 1")
+        # Create weather_data table, keyed by dateutc: every read and upsert
+        # looks rows up by timestamp, so a surrogate id would only add a second
+        # index to maintain on each insert. raw_json is JSON so payloads are
+        # validated on write and can be queried with ->/->>.
+        conn.execute(
+            f"CREATE TABLE IF NOT EXISTS weather_data ({_WEATHER_DATA_SCHEMA})"
+        )
+        self._migrate_weather_data_key()
+
+        # Every read filters and orders on dateutc, which the primary key
+        # already indexes. Older databases also carry indexes on date, which
+        # no query uses and which only add write cost.
+        for index in ("idx_dateutc", "idx_date", "idx_date_dateutc"):
+            conn.execute(f"DROP INDEX IF EXISTS {index}")
 
-        # Create weather_data table
-        # DuckDB uses BIGINT for large integers, DOUBLE for floats, INTEGER for smaller ints
+        # Create weather_stats singleton row so COUNT/date-range lookups don't scan
+        # weather_data. DuckDB has no triggers, so insert_data keeps it current.
         conn.execute("""
-            CREATE TABLE IF NOT EXISTS weather_data (
-                id INTEGER PRIMARY KEY DEFAULT nextval('weather_data_id_seq'),
-                dateutc BIGINT UNIQUE NOT NULL,
-                date VARCHAR,
-                tempf DOUBLE,
-                humidity INTEGER,
-                baromabsin DOUBLE,
-                baromrelin DOUBLE,
-                windspeedmph DOUBLE,
-                winddir INTEGER,
-                windgustmph DOUBLE,
-                maxdailygust DOUBLE,
-                hourlyrainin DOUBLE,
-                eventrain DOUBLE,
-                dailyrainin DOUBLE,
-                weeklyrainin DOUBLE,
-                monthlyrainin DOUBLE,
-                yearlyrainin DOUBLE,
-                totalrainin DOUBLE,
-                solarradiation DOUBLE,
-                uv INTEGER,
-                feelsLike DOUBLE,
-                dewPoint DOUBLE,
-                feelsLikein DOUBLE,
-                dewPointin DOUBLE,
-                lastRain VARCHAR,
-                tz VARCHAR,
-                raw_json VARCHAR
+            CREATE TABLE IF NOT EXISTS weather_stats (
+                id INTEGER PRIMARY KEY,
+                total_rows BIGINT NOT NULL DEFAULT 0,
+                min_dateutc BIGINT,
+                max_dateutc BIGINT
             )
         """)
-
-        # Create indexes for common queries
-        conn.execute("CREATE INDEX IF NOT EXISTS idx_dateutc ON weather_data(dateutc)")
-        conn.execute("CREATE INDEX IF NOT EXISTS idx_date ON weather_data(date)")
+        result = conn.execute("SELECT COUNT(*) FROM weather_stats").fetchone()
+        if not result or result[0] == 0:
+            # One-time seed for databases created before weather_stats existed
+            self.refresh_stats()
 
         # Create sequence for backfill_progress IDs (DuckDB requires explicit sequences)
         conn.execute("CREATE SEQUENCE IF NOT EXISTS backfill_progress_id_seq START 1")
@@ -122,16 +433,64 @@ class WeatherDatabase:
                 updated_at VARCHAR NOT NULL
             )
         """)
+        # Finding the backfill to resume filters on status and takes the most
+        # recently updated row
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_backfill_status
+            ON backfill_progress(status, updated_at DESC)
+        """)
 
-    def insert_data(self, data: dict | list[dict]) -> tuple[int, int]:
+    def _migrate_weather_data_key(self) -> None:
         """
-        Insert weather data into the database with idempotent INSERT OR REPLACE.
+        Rebuild a weather_data table created with the old id primary key.
+
+        DuckDB can't drop a primary key column or alter an indexed table in
+        place, so the rows are copied into a new dateutc-keyed table inside
+        one transaction. Older VARCHAR raw_json values are converted to JSON
+        along the way.
+        """
+        conn = self._get_conn()
+        columns = {row[0] for row in conn.execute("DESCRIBE weather_data").fetchall()}
+        if "id" not in columns:
+            return
+
+        column_list = ", ".join(c for c in WEATHER_COLUMNS if c in columns)
+        conn.begin()
+        try:
+            conn.execute(f"CREATE TABLE weather_data_rekeyed ({_WEATHER_DATA_SCHEMA})")
+            conn.execute(
+                f"INSERT INTO weather_data_rekeyed ({column_list}) "
+                f"SELECT {column_list} FROM weather_data"
+            )
+            conn.execute("DROP TABLE weather_data")
+            conn.execute("ALTER TABLE weather_data_rekeyed RENAME TO weather_data")
+            conn.execute("DROP SEQUENCE IF EXISTS weather_data_id_seq")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+    def insert_data(
+        self,
+        data: dict | list[dict],
+        mode: Literal["upsert", "insert_only", "replace"] = "upsert",
+    ) -> tuple[int, int]:
+        """
+        Insert weather data into the database idempotently.
 
         Handles both single dictionaries and lists of dictionaries.
         Returns the count of inserted and skipped records.
 
+        Modes for records whose dateutc already exists:
+            upsert: update the columns the record provides, NULL where it
+                sets a key to None (default)
+            insert_only: leave the stored row alone and count the record as
+                skipped; for backfills, where nearly every row is new
+            replace: overwrite every column, NULL where the record has no value
+
         Args:
             data: Single dictionary or list of dictionaries containing weather data
+            mode: How to handle records that already exist
 
         Returns:
             Tuple of (inserted_count, skipped_count)
@@ -142,87 +501,311 @@ class WeatherDatabase:
         if not isinstance(data, list):
             raise TypeError("Data must be a dictionary or list of dictionaries")
 
+        if mode not in ("upsert", "insert_only", "replace"):
+            raise ValueError(f"Invalid insert mode: {mode}")
+
         if not data:
             return 0, 0
 
         inserted_count = 0
         skipped_count = 0
-
-        # Define all possible columns in weather_data table
-        all_columns = [
-            "dateutc",
-            "date",
-            "tempf",
-            "humidity",
-            "baromabsin",
-            "baromrelin",
-            "windspeedmph",
-            "winddir",
-            "windgustmph",
-            "maxdailygust",
-            "hourlyrainin",
-            "eventrain",
-            "dailyrainin",
-            "weeklyrainin",
-            "monthlyrainin",
-            "yearlyrainin",
-            "totalrainin",
-            "solarradiation",
-            "uv",
-            "feelsLike",
-            "dewPoint",
-            "feelsLikein",
-            "dewPointin",
-            "lastRain",
-            "tz",
-            "raw_json",
-        ]
+        new_count = 0
+        new_min_dateutc: int | None = None
+        new_max_dateutc: int | None = None
 
         conn = self._get_conn()
-        for record in data:
-            try:
-                # Filter record to only include columns that exist in table
-                filtered_record = {k: v for k, v in record.items() if k in all_columns}
-
-                if not filtered_record:
-                    skipped_count += 1
-                    continue
-
-                # Check if record already exists
-                dateutc = filtered_record.get("dateutc")
-                if dateutc:
-                    existing = conn.execute(
-                        "SELECT id FROM weather_data WHERE dateutc = ?", [dateutc]
-                    ).fetchone()
-
-                    if existing:
-                        # Update existing record
-                        set_clause = ", ".join(
-                            [f"{k} = ?" for k in filtered_record.keys()]
-                        )
-                        values = list(filtered_record.values()) + [dateutc]
-                        query = (
-                            f"UPDATE weather_data SET {set_clause} WHERE dateutc = ?"
-                        )
-                        conn.execute(query, values)
+        for chunk_start in range(0, len(data), INSERT_CHUNK_SIZE):
+            chunk = data[chunk_start : chunk_start + INSERT_CHUNK_SIZE]
+            # (columns, row) for this chunk keyed by dateutc, so a duplicate
+            # later in the chunk replaces the earlier one (one statement can't
+            # upsert a key twice)
+            records: dict[int, tuple[tuple[str, ...], tuple]] = {}
+            accepted = 0
+
+            for record in chunk:
+                try:
+                    dateutc = record.get("dateutc")
+                    if not dateutc:
+                        skipped_count += 1
+                        continue
+
+                    # Key on the BIGINT value, so the existence lookup and
+                    # RETURNING compare integers and "1" and 1 are one record
+                    dateutc = int(dateutc)
+
+                    # Fixed column order, dateutc first. An upsert writes just
+                    # the keys the record has, so one set to None stores NULL
+                    # and a missing one keeps the stored value; the other
+                    # modes write every column, None for missing keys.
+                    if mode == "upsert":
+                        columns = tuple(c for c in WEATHER_COLUMNS if c in record)
                     else:
-                        # Insert new record
-                        columns = ", ".join(filtered_record.keys())
-                        placeholders = ", ".join(["?" for _ in filtered_record])
-                        values = list(filtered_record.values())
-                        query = f"INSERT INTO weather_data ({columns}) VALUES ({placeholders})"
-                        conn.execute(query, values)
-
-                    inserted_count += 1
-                else:
+                        columns = WEATHER_COLUMNS
+                    records[dateutc] = (
+                        columns,
+                        (dateutc, *map(record.get, columns[1:])),
+                    )
+                    accepted += 1
+
+                except Exception:
                     skipped_count += 1
+                    continue
 
-            except Exception:
-                skipped_count += 1
+            if not records:
                 continue
 
+            if mode == "insert_only":
+                # DO NOTHING only returns the rows it actually inserted
+                written, failed = self._write_grouped(conn, records, mode)
+                new_rows = written
+                inserted_count += len(written)
+                skipped_count += accepted - len(written)
+            else:
+                # One bulk lookup per chunk tells new rows from updates, which
+                # the upsert itself can't report, so weather_stats stays accurate
+                existing = {
+                    row[0]
+                    for row in conn.execute(
+                        "SELECT dateutc FROM weather_data WHERE dateutc IN (SELECT UNNEST(?))",
+                        [list(records)],
+                    ).fetchall()
+                }
+                written, failed = self._write_grouped(conn, records, mode)
+                new_rows = written - existing
+                inserted_count += accepted - len(failed)
+                skipped_count += len(failed)
+
+            if new_rows:
+                new_count += len(new_rows)
+                chunk_min = min(new_rows)
+                chunk_max = max(new_rows)
+                if new_min_dateutc is None or chunk_min < new_min_dateutc:
+                    new_min_dateutc = chunk_min
+                if new_max_dateutc is None or chunk_max > new_max_dateutc:
+                    new_max_dateutc = chunk_max
+
+        if new_count:
+            conn.execute(
+                """
+                UPDATE weather_stats
+                SET total_rows = total_rows + ?,
+                    min_dateutc = LEAST(min_dateutc, ?),
+                    max_dateutc = GREATEST(max_dateutc, ?)
+                WHERE id = 1
+            """,
+                [new_count, new_min_dateutc, new_max_dateutc],
+            )
+
+        if inserted_count:
+            self._mark_changed()
+
         return inserted_count, skipped_count
 
+    def _write_grouped(
+        self,
+        conn: DuckDBPyConnection,
+        records: dict[int, tuple[tuple[str, ...], tuple]],
+        mode: str,
+    ) -> tuple[set[int], set[int]]:
+        """
+        Write a chunk of records, one statement per distinct column set.
+
+        Records from one source nearly always share their keys, so this is
+        usually a single _write_records call.
+
+        Args:
+            conn: Open database connection
+            records: (columns, row) pairs keyed by dateutc
+            mode: Conflict handling, as for insert_data
+
+        Returns:
+            Tuple of (dateutc values written, dateutc values that failed)
+        """
+        groups: dict[tuple[str, ...], dict[int, tuple]] = {}
+        for dateutc, (columns, row) in records.items():
+            groups.setdefault(columns, {})[dateutc] = row
+
+        written: set[int] = set()
+        failed: set[int] = set()
+        for columns, rows in groups.items():
+            group_written, group_failed = self._write_records(conn, columns, rows, mode)
+            written |= group_written
+            failed |= group_failed
+        return written, failed
+
+    def _write_records(
+        self,
+        conn: DuckDBPyConnection,
+        columns: tuple[str, ...],
+        records: dict[int, tuple],
+        mode: str,
+    ) -> tuple[set[int], set[int]]:
+        """
+        Write a chunk of records with a single multi-row INSERT ... ON CONFLICT.
+
+        One statement per chunk is far cheaper than executemany, which DuckDB
+        runs as a separate upsert per row. If the statement fails, the rows are
+        retried one at a time so a single bad record doesn't drop the whole
+        chunk.
+
+        Args:
+            conn: Open database connection
+            columns: Column names matching each record tuple
+            records: Record tuples keyed by dateutc
+            mode: Conflict handling, as for insert_data
+
+        Returns:
+            Tuple of (dateutc values written, dateutc values that failed)
+        """
+        try:
+            if len(records) >= DATAFRAME_MIN_ROWS:
+                result = self._write_frame(conn, columns, records, mode)
+            else:
+                result = conn.execute(
+                    _values_insert_sql(columns, mode, len(records)),
+                    [value for row in records.values() for value in row],
+                ).fetchall()
+            return {row[0] for row in result}, set()
+        except Exception:
+            pass
+
+        written: set[int] = set()
+        failed: set[int] = set()
+        single_row_query = _values_insert_sql(columns, mode, 1)
+        for dateutc, row in records.items():
+            try:
+                if conn.execute(single_row_query, row).fetchall():
+                    written.add(dateutc)
+            except Exception:
+                failed.add(dateutc)
+
+        return written, failed
+
+    def _write_frame(
+        self,
+        conn: DuckDBPyConnection,
+        columns: tuple[str, ...],
+        records: dict[int, tuple],
+        mode: str,
+    ) -> list[tuple]:
+        """
+        Write records by registering them as a DataFrame and inserting from it.
+
+        DuckDB scans the frame directly instead of binding every value as a
+        statement parameter, and casts to the table's column types on insert.
+
+        Args:
+            conn: Open database connection
+            columns: Column names matching each record tuple
+            records: Record tuples keyed by dateutc
+            mode: Conflict handling, as for insert_data
+
+        Returns:
+            RETURNING rows (one dateutc per written record)
+        """
+        import pandas as pd
+
+        # object dtype keeps None as NULL rather than coercing ints to NaN floats
+        frame = pd.DataFrame(list(records.values()), columns=columns, dtype=object)
+        conn.register("incoming_weather", frame)
+        try:
+            return conn.execute(_frame_insert_sql(columns, mode)).fetchall()
+        finally:
+            conn.unregister("incoming_weather")
+
+    def import_csv(self, csv_path: str) -> int:
+        """
+        Bulk-load weather data from a CSV file such as a previous export.
+
+        DuckDB reads and inserts the file natively in one statement. Rows whose
+        dateutc already exists are left untouched, and file columns that are
+        not in weather_data (such as the id of older exports) are ignored.
+
+        Args:
+            csv_path: Path to a CSV file with a header row including dateutc
+
+        Returns:
+            Number of new records inserted
+
+        Raises:
+            ValueError: If the CSV file has no dateutc column
+        """
+        conn = self._get_conn()
+
+        # Read every field as text and cast to the table types explicitly, so
+        # type sniffing can't reformat values such as the ISO date strings
+        source = "read_csv(?, header = true, all_varchar = true)"
+        file_columns = {
+            row[0].lower()
+            for row in conn.execute(
+                f"DESCRIBE SELECT * FROM {source}", [csv_path]
+            ).fetchall()
+        }
+        table_types = {
+            row[0]: row[1] for row in conn.execute("DESCRIBE weather_data").fetchall()
+        }
+        columns = [c for c in table_types if c.lower() in file_columns]
+        if "dateutc" not in columns:
+            raise ValueError("CSV file has no dateutc column")
+
+        select_list = ", ".join(f"CAST({c} AS {table_types[c]})" for c in columns)
+        result = conn.execute(
+            f"""
+            INSERT INTO weather_data ({", ".join(columns)})
+            SELECT {select_list} FROM {source}
+            WHERE dateutc IS NOT NULL
+            ON CONFLICT (dateutc) DO NOTHING
+        """,
+            [csv_path],
+        ).fetchone()
+
+        self.refresh_stats()
+        if result and result[0]:
+            self._mark_changed()
+        return result[0] if result else 0
+
+    def refresh_stats(self) -> None:
+        """
+        Recompute the weather_stats summary row from weather_data.
+
+        Runs a full aggregate, so only call it after writes that bypass
+        insert_data (bulk loads) or to repair a drifted summary.
+        """
+        conn = self._get_conn()
+        conn.execute("DELETE FROM weather_stats")
+        conn.execute("""
+            INSERT INTO weather_stats (id, total_rows, min_dateutc, max_dateutc)
+            SELECT 1, COUNT(*), MIN(dateutc), MAX(dateutc) FROM weather_data
+        """)
+
+    def get_summary(self) -> dict:
+        """
+        Get the maintained row count and date range without scanning weather_data.
+
+        Returns:
+            Dictionary containing total_records, min_date, max_date
+        """
+        conn = self._get_conn()
+        result = conn.execute(
+            "SELECT total_rows, min_dateutc, max_dateutc FROM weather_stats WHERE id = 1"
+        ).fetchone()
+        if not result or not result[0]:
+            return {"total_records": 0, "min_date": None, "max_date": None}
+
+        total_rows, min_dateutc, max_dateutc = result
+        # Point lookups on the dateutc primary key, not a scan
+        dates = dict(
+            conn.execute(
+                "SELECT dateutc, date FROM weather_data WHERE dateutc IN (?, ?)",
+                [min_dateutc, max_dateutc],
+            ).fetchall()
+        )
+        return {
+            "total_records": total_rows,
+            "min_date": dates.get(min_dateutc),
+            "max_date": dates.get(max_dateutc),
+        }
+
     def get_data(
         self,
         start_date: str | None = None,
@@ -235,23 +818,26 @@ class WeatherDatabase:
 
         Args:
             start_date: Start date in YYYY-MM-DD format (optional)
-            end_date: End date in YYYY-MM-DD format (optional)
+            end_date: End date in YYYY-MM-DD format, inclusive (optional)
             limit: Maximum number of records to return (optional)
             order_by: ORDER BY clause (default: 'dateutc DESC')
 
         Returns:
             List of dictionaries containing weather data
+
+        Raises:
+            ValueError: If start_date or end_date is not an ISO date
         """
         query = "SELECT * FROM weather_data"
         params = []
 
         conditions = []
         if start_date:
-            conditions.append("date >= ?")
-            params.append(start_date)
+            conditions.append("dateutc >= ?")
+            params.append(iso_to_dateutc(start_date))
         if end_date:
-            conditions.append("date <= ?")
-            params.append(end_date)
+            conditions.append("dateutc < ?")
+            params.append(iso_end_to_dateutc(end_date))
 
         if conditions:
             query += " WHERE " + " AND ".join(conditions)
@@ -275,54 +861,42 @@ class WeatherDatabase:
         Get statistics about the weather data in the database.
 
         Returns:
-            Dictionary containing count, min_date, max_date
+            Dictionary containing count, min_date, max_date, and avg/min/max
+            temperature and humidity
         """
         conn = self._get_conn()
-        stats = {}
-
-        # Get total record count
-        result = conn.execute("SELECT COUNT(*) FROM weather_data").fetchone()
-        stats["total_records"] = result[0] if result else 0
-
-        if stats["total_records"] > 0:
-            # Get date range
-            result = conn.execute(
-                "SELECT MIN(date), MAX(date) FROM weather_data"
-            ).fetchone()
-            stats["min_date"] = result[0] if result else None
-            stats["max_date"] = result[1] if result else None
-
-            # Get temperature statistics
-            result = conn.execute(
-                "SELECT AVG(tempf), MIN(tempf), MAX(tempf) FROM weather_data WHERE tempf IS NOT NULL"
-            ).fetchone()
-            stats["avg_temperature"] = result[0] if result else None
-            stats["min_temperature"] = result[1] if result else None
-            stats["max_temperature"] = result[2] if result else None
-
-            # Get humidity statistics
-            result = conn.execute(
-                "SELECT AVG(humidity), MIN(humidity), MAX(humidity) FROM weather_data WHERE humidity IS NOT NULL"
-            ).fetchone()
-            stats["avg_humidity"] = result[0] if result else None
-            stats["min_humidity"] = result[1] if result else None
-            stats["max_humidity"] = result[2] if result else None
-        else:
-            stats["min_date"] = None
-            stats["max_date"] = None
-            stats["avg_temperature"] = None
-            stats["min_temperature"] = None
-            stats["max_temperature"] = None
-            stats["avg_humidity"] = None
-            stats["min_humidity"] = None
-            stats["max_humidity"] = None
 
-        return stats
+        # One pass computes every aggregate. Aggregates skip NULLs, and on an
+        # empty table everything but the count comes back NULL.
+        result = conn.execute("""
+            SELECT
+                COUNT(*),
+                MIN(date), MAX(date),
+                AVG(tempf), MIN(tempf), MAX(tempf),
+                AVG(humidity), MIN(humidity), MAX(humidity)
+            FROM weather_data
+        """).fetchone()
+        if not result:
+            result = (0,) + (None,) * 8
+
+        return {
+            "total_records": result[0],
+            "min_date": result[1],
+            "max_date": result[2],
+            "avg_temperature": result[3],
+            "min_temperature": result[4],
+            "max_temperature": result[5],
+            "avg_humidity": result[6],
+            "min_humidity": result[7],
+            "max_humidity": result[8],
+        }
 
     def init_backfill_progress(self, start_date: str, end_date: str) -> int:
         """
         Initialize a new backfill progress record.
 
+        Backfills page backward from end_date, so current_date starts there.
+
         Args:
             start_date: Start date in YYYY-MM-DD format
             end_date: End date in YYYY-MM-DD format
@@ -333,16 +907,16 @@ class WeatherDatabase:
         conn = self._get_conn()
         now = datetime.now(UTC).isoformat()
 
-        conn.execute(
+        # RETURNING gives this insert's id even if another backfill starts
+        # concurrently, without a second query
+        result = conn.execute(
             """
             INSERT INTO backfill_progress (start_date, end_date, current_date, status, created_at, updated_at)
             VALUES (?, ?, ?, 'in_progress', ?, ?)
+            RETURNING id
         """,
-            [start_date, end_date, start_date, now, now],
-        )
-
-        # Get the last inserted row id
-        result = conn.execute("SELECT MAX(id) FROM backfill_progress").fetchone()
+            [start_date, end_date, end_date, now, now],
+        ).fetchone()
         return result[0] if result else 0
 
     def get_backfill_progress(self, progress_id: int) -> dict | None:
@@ -365,6 +939,29 @@ class WeatherDatabase:
             return dict(zip(columns, result))
         return None
 
+    def get_active_backfill_progress(self) -> dict | None:
+        """
+        Get the most recently updated backfill that is still in progress.
+
+        Used to resume a backfill that was interrupted before it finished.
+
+        Returns:
+            Dictionary containing backfill progress data, or None if no
+            backfill is in progress
+        """
+        conn = self._get_conn()
+        result = conn.execute("""
+            SELECT * FROM backfill_progress
+            WHERE status = 'in_progress'
+            ORDER BY updated_at DESC
+            LIMIT 1
+        """).fetchone()
+
+        if result:
+            columns = [desc[0] for desc in conn.description]
+            return dict(zip(columns, result))
+        return None
+
     def update_backfill_progress(
         self,
         progress_id: int,
@@ -378,7 +975,7 @@ class WeatherDatabase:
 
         Args:
             progress_id: The ID of the backfill_progress record
-            current_date: Current date being processed (YYYY-MM-DD format)
+            current_date: Date or ISO datetime reached so far
             total_records: Total records processed so far
             skipped_records: Total records skipped so far
             status: Status of the backfill ('in_progress', 'completed', 'failed')
@@ -405,3 +1002,6 @@ class WeatherDatabase:
         self._get_conn().execute(
             "DELETE FROM backfill_progress WHERE id = ?", [progress_id]
         )
+
+
+atexit.register(WeatherDatabase.close_shared)
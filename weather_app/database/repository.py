@@ -3,20 +3,261 @@ Repository pattern for database operations
 Provides clean interface for querying weather data using DuckDB
 """
 
+import functools
+import threading
 import time
-from datetime import datetime
 from typing import Any
 
+from duckdb import DuckDBPyConnection
+
 from weather_app.config import DB_PATH
-from weather_app.database.engine import WeatherDatabase
+from weather_app.database.engine import (
+    WEATHER_COLUMNS,
+    WeatherDatabase,
+    data_version,
+    iso_end_to_dateutc,
+    iso_to_dateutc,
+)
 from weather_app.logging_config import get_logger, log_database_operation
 
 logger = get_logger(__name__)
 
+# Read results are cached briefly for dashboards that poll the same views.
+# Writes through WeatherDatabase in this process invalidate entries at once.
+# Other processes (e.g. the CLI) can write whenever this process has no
+# context open on the file; the next context to reopen it sees the change and
+# invalidates entries, but cache hits don't open the file, so the TTL bounds
+# how long a hit can miss such a write.
+READ_CACHE_TTL_SECONDS = 30.0
+LATEST_CACHE_TTL_SECONDS = 5.0
+READ_CACHE_MAX_ENTRIES = 256
+
+
+def _copy_result(value: Any) -> Any:
+    """Copy a query result's rows so callers can't change a cached value."""
+    if isinstance(value, list):
+        return [dict(row) if isinstance(row, dict) else row for row in value]
+    if isinstance(value, dict):
+        return dict(value)
+    return value
+
+
+class _ReadCache:
+    """
+    Thread-safe TTL cache of query results, tagged with the data version.
+
+    Values are copied in and out (see _copy_result), so every caller gets
+    rows of its own to modify.
+    """
+
+    MISS = object()
+
+    def __init__(self, max_entries: int):
+        self._max_entries = max_entries
+        self._entries: dict[tuple, tuple[float, int, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple, version: int) -> Any:
+        """Return the cached value, or MISS if absent, expired or stale."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return self.MISS
+            expires_at, entry_version, value = entry
+            if entry_version != version or expires_at <= time.monotonic():
+                del self._entries[key]
+                return self.MISS
+        return _copy_result(value)
+
+    def put(self, key: tuple, version: int, ttl: float, value: Any) -> None:
+        """Store a copy of a value, evicting the oldest entry when full."""
+        value = _copy_result(value)
+        with self._lock:
+            self._entries.pop(key, None)
+            if len(self._entries) >= self._max_entries:
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = (time.monotonic() + ttl, version, value)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+
+_read_cache = _ReadCache(READ_CACHE_MAX_ENTRIES)
+
 
 class WeatherRepository:
     """Repository for weather data operations"""
 
+    # Columns returned by the read queries, in select order, so rows can be
+    # zipped into dicts without consulting cursor.description on every call.
+    # raw_json is left out: it's the widest column, kept as a record of the
+    # API payload, and no read path returns it.
+    _COLUMNS = tuple(c for c in WEATHER_COLUMNS if c != "raw_json")
+    _SELECT_COLUMNS = ", ".join(_COLUMNS)
+
+    # Fixed query text is built once here rather than formatted on every call.
+    # Sampling counts and samples in one pass: COUNT(*) OVER () gives the range
+    # size to each row, so no separate count query is needed. Use ceiling
+    # division for the interval so sampling covers the full date range (a LIMIT
+    # would truncate before the end). Ranges within target_count get an
+    # interval of 1, i.e. every row.
+    _SAMPLED_QUERY = f"""
+        WITH ranged AS (
+            SELECT {_SELECT_COLUMNS},
+                ROW_NUMBER() OVER (ORDER BY dateutc ASC) AS rn,
+                COUNT(*) OVER () AS total
+            FROM weather_data
+            WHERE dateutc >= ? AND dateutc < ?
+        )
+        SELECT {_SELECT_COLUMNS} FROM ranged
+        WHERE (rn - 1) % GREATEST(1, (total + ? - 1) // ?) = 0
+        ORDER BY dateutc ASC
+    """
+    # The latest reading is found in two steps: MAX(dateutc) reads a single
+    # column, then the row is a point lookup on the primary key. That's about
+    # twice as fast as ORDER BY dateutc DESC LIMIT 1, which runs a top-N over
+    # every selected column (a scalar subquery is planned as a hash join and
+    # is slower still).
+    _LATEST_DATEUTC_QUERY = "SELECT MAX(dateutc) FROM weather_data"
+    _DATEUTC_RANGE_QUERY = "SELECT MIN(dateutc), MAX(dateutc) FROM weather_data"
+    # Sort orders accepted by get_all_readings, mapped to their SQL keyword.
+    # Only these fixed strings are ever interpolated into ORDER BY.
+    _ORDER_SQL = {"asc": "ASC", "desc": "DESC"}
+    _STATS_QUERY = """
+        SELECT COUNT(*), MIN(date), MAX(date),
+            (MAX(dateutc) - MIN(dateutc)) // 86400000
+        FROM weather_data
+    """
+    _READING_BY_DATEUTC_QUERY = (
+        f"SELECT {_SELECT_COLUMNS} FROM weather_data WHERE dateutc = ?"
+    )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _all_readings_query(
+        has_start: bool, has_end: bool, has_cursor: bool, order: str
+    ) -> str:
+        """
+        Build the get_all_readings query for one combination of filters.
+
+        Each variant is built once; per call only the parameters change.
+        Omitted filters are left out of the SQL entirely rather than bound as
+        NULL sentinels, so DuckDB can still prune on the dateutc range.
+        """
+        query = f"SELECT {WeatherRepository._SELECT_COLUMNS} FROM weather_data"
+        conditions = []
+        if has_start:
+            conditions.append("dateutc >= ?")
+        if has_end:
+            conditions.append("dateutc < ?")
+        if has_cursor:
+            # Keyset pagination: continue past the last row of the previous page
+            conditions.append("dateutc < ?" if order == "DESC" else "dateutc > ?")
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += f" ORDER BY dateutc {order} LIMIT ?"
+        # A cursor page starts right after the previous one, so it never skips
+        return query if has_cursor else query + " OFFSET ?"
+
+    @staticmethod
+    def _date_bounds(
+        start_date: str | None, end_date: str | None
+    ) -> tuple[int | None, int | None]:
+        """
+        Parse ISO date bounds into a half-open dateutc range.
+
+        Range filters compare the BIGINT dateutc key rather than the date
+        string, so each bound is parsed once here. The end bound is exclusive;
+        a bare end date includes that whole day.
+
+        Args:
+            start_date: Start date or datetime, or None for no lower bound
+            end_date: End date or datetime, or None for no upper bound
+
+        Returns:
+            Tuple of (start, end) in milliseconds since epoch, UTC
+
+        Raises:
+            ValueError: If either bound is not an ISO date
+        """
+        start = end = None
+        if start_date:
+            try:
+                start = iso_to_dateutc(start_date)
+            except ValueError:
+                raise ValueError("Invalid start_date format. Use YYYY-MM-DD")
+        if end_date:
+            try:
+                end = iso_end_to_dateutc(end_date)
+            except ValueError:
+                raise ValueError("Invalid end_date format. Use YYYY-MM-DD")
+        return start, end
+
+    @staticmethod
+    def _range_may_have_data(
+        conn: DuckDBPyConnection,
+        version: int,
+        start_dateutc: int | None,
+        end_dateutc: int | None,
+    ) -> bool:
+        """
+        Check whether a half-open dateutc range can overlap the stored data.
+
+        The table's first and last dateutc are cached until the data changes,
+        so filters entirely before or after the stored data (e.g. "today"
+        against data that hasn't caught up yet) are answered without a scan.
+        The cache uses the latest-reading TTL because the upper bound moves
+        with new data.
+        """
+        if start_dateutc is None and end_dateutc is None:
+            return True
+
+        cache_key = ("dateutc_range", DB_PATH)
+        bounds = _read_cache.get(cache_key, version)
+        if bounds is _ReadCache.MISS:
+            bounds = conn.execute(WeatherRepository._DATEUTC_RANGE_QUERY).fetchone()
+            _read_cache.put(cache_key, version, LATEST_CACHE_TTL_SECONDS, bounds)
+
+        first, last = bounds
+        if first is None:
+            return False
+        return (start_dateutc is None or start_dateutc <= last) and (
+            end_dateutc is None or end_dateutc > first
+        )
+
+    @staticmethod
+    def _fetch_records(
+        conn: DuckDBPyConnection, query: str, params: list[Any]
+    ) -> list[dict[str, Any]]:
+        """
+        Run a query selecting _COLUMNS and return the rows as dictionaries.
+
+        Results are materialized column-wise with fetchnumpy, which is several
+        times faster than fetchall for large results; each column is then
+        converted to Python values once (NULLs become None) and zipped into rows.
+        Each array is released as soon as it's converted, so the numpy copy of
+        the result doesn't stay alive next to the Python one.
+
+        Args:
+            conn: Open database connection
+            query: SQL selecting exactly WeatherRepository._COLUMNS, in order
+            params: Query parameters
+
+        Returns:
+            List of weather data records as dictionaries
+        """
+        arrays = conn.execute(query, params).fetchnumpy()
+        columns = WeatherRepository._COLUMNS
+        values = [arrays.pop(name).tolist() for name in columns]
+        return [dict(zip(columns, row)) for row in zip(*values)]
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop all cached read results."""
+        _read_cache.clear()
+
     @staticmethod
     def get_sampled_readings(
         start_date: str,
@@ -27,88 +268,34 @@ class WeatherRepository:
         Get evenly sampled weather readings across a date range.
 
         Uses window functions to select every Nth record to achieve
-        approximately target_count records distributed across the range.
+        approximately target_count records distributed across the range,
+        counting and sampling in a single query.
 
         Args:
             start_date: Start date (ISO format: YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS)
-            end_date: End date (ISO format: YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS)
+            end_date: End date, inclusive (ISO format: YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS)
             target_count: Target number of records to return (default 10000)
 
         Returns:
             List of weather data records as dictionaries, evenly distributed
             across the date range
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         try:
-            # Validate date formats
-            try:
-                datetime.fromisoformat(start_date)
-            except ValueError:
-                raise ValueError("Invalid start_date format. Use YYYY-MM-DD")
-
-            try:
-                datetime.fromisoformat(end_date)
-            except ValueError:
-                raise ValueError("Invalid end_date format. Use YYYY-MM-DD")
+            start_dateutc, end_dateutc = WeatherRepository._date_bounds(
+                start_date, end_date
+            )
 
             with WeatherDatabase(DB_PATH) as db:
                 conn = db._get_conn()
 
-                # First, get total count for the range
-                count_query = """
-                    SELECT COUNT(*) FROM weather_data
-                    WHERE date >= ? AND date <= ?
-                """
-                count_result = conn.execute(
-                    count_query, [start_date, end_date]
-                ).fetchone()
-                total = count_result[0] if count_result else 0
-
-                if total == 0:
-                    duration_ms = (time.time() - start_time) * 1000
-                    log_database_operation(
-                        logger,
-                        "SELECT",
-                        "weather_data",
-                        records=0,
-                        duration_ms=duration_ms,
-                    )
-                    return []
-
-                if total <= target_count:
-                    # No sampling needed - return all records
-                    query = """
-                        SELECT * FROM weather_data
-                        WHERE date >= ? AND date <= ?
-                        ORDER BY dateutc ASC
-                    """
-                    result = conn.execute(query, [start_date, end_date]).fetchall()
-                else:
-                    # Sample every Nth record using ROW_NUMBER window function
-                    # Use ceiling division to ensure we cover the full date range
-                    # This prevents the bug where LIMIT truncated data before
-                    # reaching the end of the dataset
-                    sample_interval = max(1, (total + target_count - 1) // target_count)
-                    query = """
-                        SELECT * EXCLUDE (rn) FROM (
-                            SELECT *, ROW_NUMBER() OVER (ORDER BY dateutc ASC) as rn
-                            FROM weather_data
-                            WHERE date >= ? AND date <= ?
-                        )
-                        WHERE (rn - 1) % ? = 0
-                        ORDER BY dateutc ASC
-                    """
-                    result = conn.execute(
-                        query, [start_date, end_date, sample_interval]
-                    ).fetchall()
-
-                # Convert to list of dictionaries
-                records = []
-                if result:
-                    columns = [desc[0] for desc in conn.description]
-                    records = [dict(zip(columns, row)) for row in result]
+                records = WeatherRepository._fetch_records(
+                    conn,
+                    WeatherRepository._SAMPLED_QUERY,
+                    [start_dateutc, end_dateutc, target_count, target_count],
+                )
 
-                duration_ms = (time.time() - start_time) * 1000
+                duration_ms = (time.perf_counter() - start_time) * 1000
                 log_database_operation(
                     logger,
                     "SELECT",
@@ -123,7 +310,7 @@ class WeatherRepository:
             # Re-raise ValueError for date validation
             raise
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000
             log_database_operation(
                 logger, "SELECT", "weather_data", duration_ms=duration_ms, error=str(e)
             )
@@ -136,61 +323,92 @@ class WeatherRepository:
         start_date: str | None = None,
         end_date: str | None = None,
         order: str = "desc",
+        cursor: int | None = None,
     ) -> list[dict[str, Any]]:
         """
         Query weather data from the database
 
+        For deep pagination prefer cursor over offset: OFFSET still reads and
+        discards every skipped row, while a cursor starts right after the
+        previous page. The two can't be combined.
+
         Args:
             limit: Maximum number of records to return (1-10000)
             offset: Number of records to skip (for pagination)
             start_date: Filter by start date (ISO format: YYYY-MM-DD)
-            end_date: Filter by end date (ISO format: YYYY-MM-DD)
+            end_date: Filter by end date, inclusive (ISO format: YYYY-MM-DD)
             order: Sort order by date ('asc' or 'desc')
+            cursor: dateutc of the last record of the previous page; only
+                records after it (in the requested order) are returned.
+                offset must be 0 when a cursor is given.
 
         Returns:
             List of weather data records as dictionaries
+
+        Raises:
+            ValueError: If order isn't 'asc' or 'desc', or a cursor is given
+                with a nonzero offset
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
+        order_sql = WeatherRepository._ORDER_SQL.get(order.lower())
+        if order_sql is None:
+            raise ValueError("Invalid order. Use 'asc' or 'desc'")
+        if cursor is not None and offset:
+            raise ValueError("offset can't be combined with cursor")
+
+        cache_key = (
+            "all_readings",
+            DB_PATH,
+            limit,
+            offset,
+            start_date,
+            end_date,
+            order_sql,
+            cursor,
+        )
+        cached = _read_cache.get(cache_key, data_version(DB_PATH))
+        if cached is not _ReadCache.MISS:
+            return cached
+
         try:
+            start_dateutc, end_dateutc = WeatherRepository._date_bounds(
+                start_date, end_date
+            )
+            params: list[Any] = []
+
+            # Add date filters if provided
+            if start_dateutc is not None:
+                params.append(start_dateutc)
+
+            if end_dateutc is not None:
+                params.append(end_dateutc)
+
+            if cursor is not None:
+                params.append(cursor)
+
+            # Add limit, and offset for pages without a cursor
+            params.append(limit)
+            if cursor is None:
+                params.append(offset)
+
+            query = WeatherRepository._all_readings_query(
+                start_dateutc is not None,
+                end_dateutc is not None,
+                cursor is not None,
+                order_sql,
+            )
+
             with WeatherDatabase(DB_PATH) as db:
                 conn = db._get_conn()
-                # Build query
-                query = "SELECT * FROM weather_data WHERE 1=1"
-                params: list[Any] = []
-
-                # Add date filters if provided
-                if start_date:
-                    try:
-                        datetime.fromisoformat(start_date)  # Validate format
-                        query += " AND date >= ?"
-                        params.append(start_date)
-                    except ValueError:
-                        raise ValueError("Invalid start_date format. Use YYYY-MM-DD")
-
-                if end_date:
-                    try:
-                        datetime.fromisoformat(end_date)  # Validate format
-                        query += " AND date <= ?"
-                        params.append(end_date)
-                    except ValueError:
-                        raise ValueError("Invalid end_date format. Use YYYY-MM-DD")
-
-                # Add sorting
-                query += f" ORDER BY dateutc {order.upper()}"
-
-                # Add limit and offset
-                query += " LIMIT ? OFFSET ?"
-                params.extend([limit, offset])
-
-                result = conn.execute(query, params).fetchall()
-
-                # Convert to list of dictionaries
+                version = data_version(DB_PATH)
                 records = []
-                if result:
-                    columns = [desc[0] for desc in conn.description]
-                    records = [dict(zip(columns, row)) for row in result]
+                if WeatherRepository._range_may_have_data(
+                    conn, version, start_dateutc, end_dateutc
+                ):
+                    records = WeatherRepository._fetch_records(conn, query, params)
+                _read_cache.put(cache_key, version, READ_CACHE_TTL_SECONDS, records)
 
-                duration_ms = (time.time() - start_time) * 1000
+                duration_ms = (time.perf_counter() - start_time) * 1000
                 log_database_operation(
                     logger,
                     "SELECT",
@@ -202,7 +420,7 @@ class WeatherRepository:
                 return records
 
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000
             log_database_operation(
                 logger, "SELECT", "weather_data", duration_ms=duration_ms, error=str(e)
             )
@@ -216,22 +434,31 @@ class WeatherRepository:
         Returns:
             Latest weather data record as dictionary, or None if no data exists
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
+        cache_key = ("latest_reading", DB_PATH)
+        cached = _read_cache.get(cache_key, data_version(DB_PATH))
+        if cached is not _ReadCache.MISS:
+            return cached
+
         try:
             with WeatherDatabase(DB_PATH) as db:
                 conn = db._get_conn()
-                result = conn.execute("""
-                    SELECT * FROM weather_data
-                    ORDER BY dateutc DESC
-                    LIMIT 1
-                """).fetchone()
+                version = data_version(DB_PATH)
+                latest = conn.execute(
+                    WeatherRepository._LATEST_DATEUTC_QUERY
+                ).fetchone()[0]
+                result = None
+                if latest is not None:
+                    result = conn.execute(
+                        WeatherRepository._READING_BY_DATEUTC_QUERY, [latest]
+                    ).fetchone()
 
                 record = None
                 if result:
-                    columns = [desc[0] for desc in conn.description]
-                    record = dict(zip(columns, result))
+                    record = dict(zip(WeatherRepository._COLUMNS, result))
+                _read_cache.put(cache_key, version, LATEST_CACHE_TTL_SECONDS, record)
 
-                duration_ms = (time.time() - start_time) * 1000
+                duration_ms = (time.perf_counter() - start_time) * 1000
                 log_database_operation(
                     logger,
                     "SELECT",
@@ -243,7 +470,7 @@ class WeatherRepository:
                 return record
 
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000
             log_database_operation(
                 logger, "SELECT", "weather_data", duration_ms=duration_ms, error=str(e)
             )
@@ -257,51 +484,24 @@ class WeatherRepository:
         Returns:
             Dictionary with total_records, min_date, max_date, and date_range_days
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
+        cache_key = ("stats", DB_PATH)
+        cached = _read_cache.get(cache_key, data_version(DB_PATH))
+        if cached is not _ReadCache.MISS:
+            return cached
+
         try:
             with WeatherDatabase(DB_PATH) as db:
                 conn = db._get_conn()
-                # Get total count
-                count_result = conn.execute(
-                    "SELECT COUNT(*) as count FROM weather_data"
-                ).fetchone()
-                total_records = count_result[0] if count_result else 0
-
-                if total_records == 0:
-                    duration_ms = (time.time() - start_time) * 1000
-                    log_database_operation(
-                        logger,
-                        "SELECT",
-                        "weather_data",
-                        records=0,
-                        duration_ms=duration_ms,
-                    )
-                    return {
-                        "total_records": 0,
-                        "min_date": None,
-                        "max_date": None,
-                        "date_range_days": None,
-                    }
-
-                # Get date range
-                date_result = conn.execute(
-                    "SELECT MIN(date) as min_date, MAX(date) as max_date FROM weather_data"
+                version = data_version(DB_PATH)
+                # Count, date range and its length in whole days in a single
+                # aggregation pass; the day count is integer math on dateutc
+                # (NULL for an empty table)
+                total_records, min_date, max_date, date_range_days = conn.execute(
+                    WeatherRepository._STATS_QUERY
                 ).fetchone()
 
-                min_date = date_result[0] if date_result else None
-                max_date = date_result[1] if date_result else None
-
-                # Calculate date range in days
-                date_range_days = None
-                if min_date and max_date:
-                    try:
-                        min_dt = datetime.fromisoformat(min_date)
-                        max_dt = datetime.fromisoformat(max_date)
-                        date_range_days = (max_dt - min_dt).days
-                    except Exception:
-                        pass
-
-                duration_ms = (time.time() - start_time) * 1000
+                duration_ms = (time.perf_counter() - start_time) * 1000
                 log_database_operation(
                     logger,
                     "SELECT",
@@ -310,15 +510,17 @@ class WeatherRepository:
                     duration_ms=duration_ms,
                 )
 
-                return {
+                stats = {
                     "total_records": total_records,
                     "min_date": min_date,
                     "max_date": max_date,
                     "date_range_days": date_range_days,
                 }
+                _read_cache.put(cache_key, version, READ_CACHE_TTL_SECONDS, stats)
+                return stats
 
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000
             log_database_operation(
                 logger, "SELECT", "weather_data", duration_ms=duration_ms, error=str(e)
             )
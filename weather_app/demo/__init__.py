@@ -3,14 +3,29 @@ Demo Mode Module
 
 Provides synthetic weather data for evaluating the Weather Dashboard
 without requiring real Ambient Weather hardware or API credentials.
+
+Exports are loaded on first access (PEP 562), so importing the package for
+DemoService doesn't also load the data generator and generation service.
 """
 
-from weather_app.demo.data_generator import GenerationCancelledError
-from weather_app.demo.demo_service import DemoService
-from weather_app.demo.generation_service import (
-    DemoGenerationService,
-    get_generation_service,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from weather_app.demo.data_generator import GenerationCancelledError
+    from weather_app.demo.demo_service import DemoService
+    from weather_app.demo.generation_service import (
+        DemoGenerationService,
+        get_generation_service,
+    )
+
+# Public name -> module that defines it
+_LAZY_EXPORTS = {
+    "DemoService": "weather_app.demo.demo_service",
+    "DemoGenerationService": "weather_app.demo.generation_service",
+    "GenerationCancelledError": "weather_app.demo.data_generator",
+    "get_generation_service": "weather_app.demo.generation_service",
+}
 
 __all__ = [
     "DemoService",
@@ -18,3 +33,18 @@ __all__ = [
     "GenerationCancelledError",
     "get_generation_service",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -12,15 +12,60 @@ The data includes:
 Run with: python -m weather_app.demo.data_generator
 """
 
-import json
 import math
-import random
 from collections.abc import Callable
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import TypedDict
-
-import duckdb
+from typing import TYPE_CHECKING, TypedDict
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Columns of generated readings, in generate_readings' key order. raw_json
+# holds the original API payload in production; demo readings have none, so
+# it is left NULL.
+READING_COLUMNS = (
+    "dateutc",
+    "date",
+    "tempf",
+    "feelsLike",
+    "dewPoint",
+    "humidity",
+    "baromrelin",
+    "baromabsin",
+    "windspeedmph",
+    "windgustmph",
+    "winddir",
+    "maxdailygust",
+    "hourlyrainin",
+    "eventrain",
+    "dailyrainin",
+    "weeklyrainin",
+    "monthlyrainin",
+    "yearlyrainin",
+    "totalrainin",
+    "solarradiation",
+    "uv",
+    "feelsLikein",
+    "dewPointin",
+    "lastRain",
+    "tz",
+)
+
+# Rain intensity bands (in/hr) an event picks from with equal odds
+RAIN_INTENSITY_BANDS = np.array(
+    [
+        (0.01, 0.05),  # Light drizzle (most common)
+        (0.01, 0.05),
+        (0.05, 0.15),  # Moderate rain
+        (0.15, 0.40),  # Heavy rain (rare)
+    ]
+)
+
+# Readings are generated, inserted and reported on this many days at a time
+CHUNK_DAYS = 10
 
 
 class GenerationCancelledError(Exception):
@@ -123,17 +168,169 @@ SEATTLE_CLIMATE: SeattleClimateData = {
 }
 
 
-class SeattleWeatherGenerator:
-    """Generates realistic Seattle weather data."""
+def _month_lut(values: dict[int, int] | dict[int, float]) -> np.ndarray:
+    """Monthly values as an array indexed by month number (index 0 unused)."""
+    return np.array([0, *(values[m] for m in range(1, 13))], dtype=float)
+
+
+# Monthly climate parameters as lookup tables, so a whole array of months
+# can be indexed at once: AVG_TEMPS[month]
+AVG_TEMPS = _month_lut(SEATTLE_CLIMATE["avg_temps"])
+TEMP_RANGES = _month_lut(SEATTLE_CLIMATE["temp_ranges"])
+RAIN_PROBABILITY = _month_lut(SEATTLE_CLIMATE["rain_probability"])
+AVG_HUMIDITY = _month_lut(SEATTLE_CLIMATE["avg_humidity"])
+AVG_WIND = _month_lut(SEATTLE_CLIMATE["avg_wind"])
+
+# Seasonal sunrise/sunset hours: short days Nov-Jan, long days May-Jul
+SUNRISE = np.array([0, 7.5, 6.0, 6.0, 6.0, 5.0, 5.0, 5.0, 6.0, 6.0, 6.0, 7.5, 7.5])
+SUNSET = np.array(
+    [0, 16.5, 19.0, 19.0, 19.0, 21.0, 21.0, 21.0, 19.0, 19.0, 19.0, 16.5, 16.5]
+)
+
+# Prevailing wind direction: SW (225) Nov-Feb, NW (315) May-Aug, W otherwise
+BASE_WIND_DIR = np.array(
+    [0, 225, 225, 270, 270, 315, 315, 315, 315, 270, 270, 225, 225]
+)
+
+# Months whose midday UV index gets a summer boost (Jun-Aug)
+UV_SUMMER_BOOST = np.array([m in (6, 7, 8) for m in range(13)])
+
+# Radians per hour of day, per month and per day of year. Folding the
+# constants makes each sine argument one array multiply rather than two
+# or three.
+_PI_OVER_12 = math.pi / 12
+_PI_OVER_6 = math.pi / 6
+_TWO_PI_OVER_365 = 2 * math.pi / 365
+
+
+def _running(
+    values: np.ndarray,
+    periods: np.ndarray,
+    carry_period: int,
+    carry: float,
+    ufunc: np.ufunc = np.add,
+) -> np.ndarray:
+    """
+    Accumulate values with a ufunc, restarting whenever the period changes.
+
+    The first period continues from carry when it is the same period the
+    previous chunk ended in (carry_period).
+    """
+    result = np.empty(len(values))
+    bounds = [0, *(np.flatnonzero(periods[1:] != periods[:-1]) + 1), len(values)]
+    for start, end in zip(bounds, bounds[1:]):
+        segment = ufunc.accumulate(values[start:end])
+        if start == 0 and periods[0] == carry_period:
+            segment = ufunc(segment, carry)
+        result[start:end] = segment
+    return result
+
+
+def _local_dateutc(times: np.ndarray) -> np.ndarray:
+    """
+    Convert naive local wall-clock times to epoch milliseconds.
+
+    Matches int(dt.timestamp() * 1000): the UTC offset is looked up once per
+    hour with the system time zone, since DST transitions fall on the hour.
+    """
+    hours = times.astype("datetime64[h]")
+    span = np.arange(hours[0], hours[-1] + 1)
+    offsets = np.array(
+        [int(dt.timestamp() * 1000) for dt in span.astype(datetime)], dtype=np.int64
+    ) - span.astype("datetime64[ms]").astype(np.int64)
+    return (
+        times.astype("datetime64[ms]").astype(np.int64)
+        + offsets[(hours - hours[0]).astype(np.int64)]
+    )
 
-    def __init__(self, db_path: str | Path) -> None:
-        """Initialize generator with database path."""
-        self.db_path = Path(db_path)
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self.conn = duckdb.connect(str(self.db_path))
-        self._create_tables()
 
-        # State for weather continuity
+def _pressure_walk(steps: list[float], trend: float) -> np.ndarray:
+    """
+    Run the pressure trend random walk, clamped to +/-0.1 inHg.
+
+    Each step starts from the clamped previous one, so this can't be a
+    cumsum. It loops over plain floats, which is far cheaper than indexing
+    NumPy arrays element by element.
+    """
+    walk = []
+    for step in steps:
+        trend += step
+        if trend > 0.1:
+            trend = 0.1
+        elif trend < -0.1:
+            trend = -0.1
+        walk.append(trend)
+    return np.array(walk)
+
+
+def _rain_events(
+    starts: list[bool],
+    durations: list[float],
+    intensities: list[float],
+    in_event: bool,
+    intensity: float,
+    remaining_hours: float,
+) -> tuple[np.ndarray, np.ndarray, tuple[bool, float, float]]:
+    """
+    Step the rain event state machine through consecutive readings.
+
+    An event can only start between events, so whether each reading rains
+    depends on all the readings before it. The random draws for every
+    reading are made up front and passed in as plain lists.
+
+    Args:
+        starts: Whether an event would start at each reading
+        durations: Length in hours of an event starting at each reading
+        intensities: Intensity of an event starting at each reading
+        in_event, intensity, remaining_hours: Event state to continue from
+
+    Returns:
+        Event intensity at each reading (0 outside events), whether an event
+        ended at each reading, and the event state to continue from
+    """
+    event_intensity = []
+    ended = []
+    for start, duration, new_intensity in zip(starts, durations, intensities):
+        if not in_event and start:
+            in_event = True
+            remaining_hours = duration
+            intensity = new_intensity
+
+        if in_event:
+            event_intensity.append(intensity)
+            # Decrement event timer (5 min = 1/12 hour)
+            remaining_hours -= 1 / 12
+            in_event = remaining_hours > 0
+            ended.append(not in_event)
+        else:
+            event_intensity.append(0.0)
+            ended.append(False)
+
+    return (
+        np.array(event_intensity),
+        np.array(ended),
+        (in_event, intensity, remaining_hours),
+    )
+
+
+class SeattleWeatherSimulator:
+    """
+    Simulates realistic Seattle weather readings, without a database.
+
+    Rain events, the pressure trend and rain totals carry over from one
+    reading to the next, so readings must be generated in time order.
+    """
+
+    def __init__(self, seed: int | None = None) -> None:
+        """
+        Initialize the simulator.
+
+        Args:
+            seed: Random seed for reproducible data (default: fresh randomness)
+        """
+        self._rng = np.random.default_rng(seed)
+
+        # State for weather continuity, carried from one chunk to the next
         self._in_rain_event = False
         self._rain_event_intensity = 0.0
         self._rain_event_remaining_hours = 0.0
@@ -149,344 +346,433 @@ class SeattleWeatherGenerator:
         self._last_rain_date: str | None = None
         self._max_daily_gust = 0.0
 
-        # Track time periods for resets
+        # Periods the totals above belong to, for resets
         self._last_day = -1
         self._last_week = -1
         self._last_month = -1
         self._last_year = -1
 
-    def _create_tables(self) -> None:
-        """Create the weather_data table with same schema as production."""
-        self.conn.execute("CREATE SEQUENCE IF NOT EXISTS weather_data_id_seq START 1")
-
-        self.conn.execute("""
-            CREATE TABLE IF NOT EXISTS weather_data (
-                id INTEGER PRIMARY KEY DEFAULT nextval('weather_data_id_seq'),
-                dateutc BIGINT UNIQUE NOT NULL,
-                date VARCHAR,
-                tempf DOUBLE,
-                humidity INTEGER,
-                baromabsin DOUBLE,
-                baromrelin DOUBLE,
-                windspeedmph DOUBLE,
-                winddir INTEGER,
-                windgustmph DOUBLE,
-                maxdailygust DOUBLE,
-                hourlyrainin DOUBLE,
-                eventrain DOUBLE,
-                dailyrainin DOUBLE,
-                weeklyrainin DOUBLE,
-                monthlyrainin DOUBLE,
-                yearlyrainin DOUBLE,
-                totalrainin DOUBLE,
-                solarradiation DOUBLE,
-                uv INTEGER,
-                feelsLike DOUBLE,
-                dewPoint DOUBLE,
-                feelsLikein DOUBLE,
-                dewPointin DOUBLE,
-                lastRain VARCHAR,
-                tz VARCHAR,
-                raw_json VARCHAR
-            )
-        """)
-
-        self.conn.execute(
-            "CREATE INDEX IF NOT EXISTS idx_dateutc ON weather_data(dateutc)"
-        )
-        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_date ON weather_data(date)")
-
-    def _get_seasonal_temp(self, dt: datetime) -> float:
-        """Calculate temperature based on season and time of day."""
-        month = dt.month
-        hour = dt.hour + dt.minute / 60.0
-
+    def _get_seasonal_temp(self, month: np.ndarray, hour: np.ndarray) -> np.ndarray:
+        """Calculate temperatures based on season and time of day."""
         # Base monthly temperature
-        base_temp = SEATTLE_CLIMATE["avg_temps"][month]
-        temp_range = SEATTLE_CLIMATE["temp_ranges"][month]
+        base_temp = AVG_TEMPS[month]
+        temp_range = TEMP_RANGES[month]
 
         # Daily cycle: coldest at 5am, warmest at 3pm
-        daily_offset = (temp_range / 2) * math.sin((hour - 5) * math.pi / 12)
+        daily_offset = (temp_range / 2) * np.sin((hour - 5) * _PI_OVER_12)
 
         # Add random variation
-        noise = random.gauss(0, 2)
+        noise = self._rng.normal(0, 2, len(month))
 
         return base_temp + daily_offset + noise
 
-    def _get_humidity(self, dt: datetime, temp: float) -> int:
+    def _get_humidity(self, month: np.ndarray, temp: np.ndarray) -> np.ndarray:
         """Calculate humidity based on month and temperature."""
-        month = dt.month
-        base_humidity = SEATTLE_CLIMATE["avg_humidity"][month]
+        base_humidity = AVG_HUMIDITY[month]
 
         # Humidity inversely related to temperature deviation
-        avg_temp = SEATTLE_CLIMATE["avg_temps"][month]
+        avg_temp = AVG_TEMPS[month]
         temp_effect = (avg_temp - temp) * 1.5
 
         # Add random variation
-        noise = random.gauss(0, 5)
+        noise = self._rng.normal(0, 5, len(month))
 
-        humidity = int(base_humidity + temp_effect + noise)
-        return max(30, min(100, humidity))
+        humidity = np.trunc(base_humidity + temp_effect + noise)
+        return np.clip(humidity, 30, 100).astype(np.int64)
 
-    def _update_pressure(self, dt: datetime) -> tuple[float, float]:
+    def _update_pressure(self, month: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
         """Update barometric pressure with weather front simulation."""
         # Random walk for pressure trend
-        self._pressure_trend += random.gauss(0, 0.01)
-        self._pressure_trend = max(-0.1, min(0.1, self._pressure_trend))
+        trend = _pressure_walk(
+            self._rng.normal(0, 0.01, len(month)).tolist(), self._pressure_trend
+        )
+        self._pressure_trend = trend[-1]
 
         # Base pressure varies by season (slightly lower in winter)
-        month = dt.month
-        seasonal_base = 30.0 - 0.15 * math.sin((month - 1) * math.pi / 6)
+        seasonal_base = 30.0 - 0.15 * np.sin((month - 1) * _PI_OVER_6)
 
         # Apply trend and noise
-        baromrelin = seasonal_base + self._pressure_trend + random.gauss(0, 0.05)
-        baromrelin = max(29.2, min(30.8, baromrelin))
+        baromrelin = seasonal_base + trend + self._rng.normal(0, 0.05, len(month))
+        baromrelin = np.clip(baromrelin, 29.2, 30.8)
 
         # Absolute pressure slightly lower (elevation adjustment for Seattle ~500ft)
         baromabsin = baromrelin - 0.5
 
         return baromrelin, baromabsin
 
-    def _update_rain(self, dt: datetime, pressure: float) -> tuple[float, float, float]:
+    def _update_rain(
+        self, month: np.ndarray, hour: np.ndarray, pressure: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
         """
-        Update rain state and return hourly, event, and daily rain amounts.
+        Update rain state and return hourly and event rain amounts.
 
         Seattle rain characteristics:
         - Light drizzle is most common
         - Extended multi-day rain events in fall/winter
         - Brief showers possible year-round
         """
-        month = dt.month
-        hour = dt.hour
-
-        # Check if we should start a new rain event
-        if not self._in_rain_event:
-            # Base probability from climate data
-            base_prob = SEATTLE_CLIMATE["rain_probability"][month]
-
-            # Low pressure increases rain chance significantly
-            pressure_factor = max(0, (30.0 - pressure) * 2)
-
-            # Night/early morning slightly more likely
-            time_factor = 1.2 if (hour < 8 or hour > 20) else 1.0
-
-            start_prob = base_prob * time_factor * (1 + pressure_factor)
-
-            if random.random() < start_prob * 0.02:  # Per 5-min check
-                self._in_rain_event = True
-                # Seattle rain events typically last 2-12 hours
-                self._rain_event_remaining_hours = random.uniform(2, 12)
-                # Most Seattle rain is light (drizzle)
-                self._rain_event_intensity = random.choice(
-                    [
-                        random.uniform(0.01, 0.05),  # Light drizzle (most common)
-                        random.uniform(0.01, 0.05),
-                        random.uniform(0.05, 0.15),  # Moderate rain
-                        random.uniform(0.15, 0.40),  # Heavy rain (rare)
-                    ]
-                )
+        n = len(month)
 
-        hourly_rain = 0.0
+        # Base probability from climate data
+        base_prob = RAIN_PROBABILITY[month]
 
-        if self._in_rain_event:
-            # Vary intensity within the event
-            intensity_variation = random.uniform(0.5, 1.5)
-            hourly_rain = self._rain_event_intensity * intensity_variation
+        # Low pressure increases rain chance significantly
+        pressure_factor = np.maximum(0, (30.0 - pressure) * 2)
 
-            # Small chance of brief pause in rain
-            if random.random() < 0.1:
-                hourly_rain = 0.0
+        # Night/early morning slightly more likely
+        time_factor = np.where((hour < 8) | (hour > 20), 1.2, 1.0)
 
-            # Decrement event timer (5 min = 1/12 hour)
-            self._rain_event_remaining_hours -= 1 / 12
+        start_prob = base_prob * time_factor * (1 + pressure_factor)
+        starts = self._rng.random(n) < start_prob * 0.02  # Per 5-min check
 
-            if self._rain_event_remaining_hours <= 0:
-                self._in_rain_event = False
-                self._event_rain = 0.0
+        # Duration and intensity for an event starting at each reading. Seattle
+        # rain events typically last 2-12 hours and are mostly light (drizzle).
+        durations = self._rng.uniform(2, 12, n)
+        bands = RAIN_INTENSITY_BANDS[self._rng.integers(0, 4, n)]
+        intensities = self._rng.uniform(bands[:, 0], bands[:, 1])
 
-        # Update totals
-        if hourly_rain > 0:
-            self._total_rain += hourly_rain
-            self._yearly_rain += hourly_rain
-            self._monthly_rain += hourly_rain
-            self._weekly_rain += hourly_rain
-            self._daily_rain += hourly_rain
-            self._event_rain += hourly_rain
-            self._last_rain_date = dt.isoformat()
+        event_intensity, ended, state = _rain_events(
+            starts.tolist(),
+            durations.tolist(),
+            intensities.tolist(),
+            self._in_rain_event,
+            self._rain_event_intensity,
+            self._rain_event_remaining_hours,
+        )
+        (
+            self._in_rain_event,
+            self._rain_event_intensity,
+            self._rain_event_remaining_hours,
+        ) = state
 
-        return hourly_rain, self._event_rain, self._daily_rain
+        # Vary intensity within the event, with a small chance of a brief pause
+        hourly_rain = event_intensity * self._rng.uniform(0.5, 1.5, n)
+        hourly_rain[self._rng.random(n) < 0.1] = 0.0
 
-    def _get_wind(self, dt: datetime, pressure: float) -> tuple[float, int, float]:
-        """Calculate wind speed, direction, and gust."""
-        month = dt.month
-        hour = dt.hour
+        # Event rain restarts on the reading an event ends
+        event_rain = _running(hourly_rain, np.cumsum(ended), 0, self._event_rain)
+        self._event_rain = event_rain[-1]
+
+        return hourly_rain, event_rain
 
+    def _get_wind(
+        self, month: np.ndarray, hour: np.ndarray, pressure: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Calculate wind speed, direction, and gust."""
         # Base wind from climate data
-        base_wind = SEATTLE_CLIMATE["avg_wind"][month]
+        base_wind = AVG_WIND[month]
 
         # Wind typically higher in afternoon
-        time_factor = 1.0 + 0.3 * math.sin((hour - 6) * math.pi / 12)
+        time_factor = 1.0 + 0.3 * np.sin((hour - 6) * _PI_OVER_12)
 
         # Low pressure increases wind
-        pressure_factor = 1.0 + max(0, (30.0 - pressure) * 0.5)
+        pressure_factor = 1.0 + np.maximum(0, (30.0 - pressure) * 0.5)
 
         wind_speed = base_wind * time_factor * pressure_factor
-        wind_speed += random.gauss(0, 2)
-        wind_speed = max(0, wind_speed)
+        wind_speed += self._rng.normal(0, 2, len(month))
+        wind_speed = np.maximum(0, wind_speed)
 
         # Gusts are typically 1.5-2.5x sustained speed
-        gust_factor = random.uniform(1.3, 2.0)
+        gust_factor = self._rng.uniform(1.3, 2.0, len(month))
         wind_gust = wind_speed * gust_factor
 
-        # Track max daily gust
-        self._max_daily_gust = max(self._max_daily_gust, wind_gust)
-
         # Wind direction (Seattle: predominantly from SW in winter, NW in summer)
-        if month in [11, 12, 1, 2]:
-            base_dir = 225  # Southwest
-        elif month in [5, 6, 7, 8]:
-            base_dir = 315  # Northwest
-        else:
-            base_dir = 270  # West
+        base_dir = BASE_WIND_DIR[month]
 
-        wind_dir = int(base_dir + random.gauss(0, 30)) % 360
+        wind_dir = np.trunc(base_dir + self._rng.normal(0, 30, len(month)))
+        wind_dir = wind_dir.astype(np.int64) % 360
 
-        return round(wind_speed, 1), wind_dir, round(wind_gust, 1)
+        return np.round(wind_speed, 1), wind_dir, np.round(wind_gust, 1)
 
-    def _get_solar_uv(self, dt: datetime) -> tuple[float, int]:
+    def _get_solar_uv(
+        self, month: np.ndarray, hour: np.ndarray, day_of_year: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
         """Calculate solar radiation and UV index."""
-        month = dt.month
-        hour = dt.hour + dt.minute / 60.0
-
-        # No sun at night
-        if hour < 6 or hour > 20:
-            return 0.0, 0
-
         # Sunrise/sunset times vary by season
-        if month in [11, 12, 1]:
-            sunrise, sunset = 7.5, 16.5
-        elif month in [5, 6, 7]:
-            sunrise, sunset = 5.0, 21.0
-        else:
-            sunrise, sunset = 6.0, 19.0
+        sunrise = SUNRISE[month]
+        sunset = SUNSET[month]
 
-        if hour < sunrise or hour > sunset:
-            return 0.0, 0
+        # No sun at night
+        daylight = (hour >= 6) & (hour <= 20) & (hour >= sunrise) & (hour <= sunset)
 
         # Solar angle factor
         day_length = sunset - sunrise
         solar_progress = (hour - sunrise) / day_length
-        solar_angle = math.sin(solar_progress * math.pi)
+        solar_angle = np.sin(solar_progress * math.pi)
 
         # Seasonal factor (max in summer)
-        day_of_year = dt.timetuple().tm_yday
-        seasonal_factor = 0.6 + 0.4 * math.sin((day_of_year - 80) * 2 * math.pi / 365)
+        seasonal_factor = 0.6 + 0.4 * np.sin((day_of_year - 80) * _TWO_PI_OVER_365)
 
         # Cloud cover effect (more clouds in winter)
-        cloud_factor = 1.0 - SEATTLE_CLIMATE["rain_probability"][month] * 0.6
-        cloud_factor *= random.uniform(0.7, 1.0)  # Random cloud variation
+        cloud_factor = 1.0 - RAIN_PROBABILITY[month] * 0.6
+        cloud_factor *= self._rng.uniform(0.7, 1.0, len(month))  # Cloud variation
 
         # Calculate solar radiation (W/m²)
         max_solar = 1000  # Peak solar radiation
         solar = max_solar * solar_angle * seasonal_factor * cloud_factor
-        solar = max(0, solar + random.gauss(0, 30))
+        solar = np.maximum(0, solar + self._rng.normal(0, 30, len(month)))
 
         # UV index (roughly correlates with solar/100, max around 10-11)
-        uv = int(solar / 100)
-        if month in [6, 7, 8] and hour > 10 and hour < 16:
-            uv = min(uv + random.randint(0, 2), 11)
-        uv = max(0, min(11, uv))
-
-        return round(solar, 1), uv
-
-    def _reset_counters(self, dt: datetime) -> None:
-        """Reset rain counters at appropriate intervals."""
-        day = dt.day
-        week = dt.isocalendar()[1]
-        month = dt.month
-        year = dt.year
+        uv = np.trunc(solar / 100)
+        summer_midday = UV_SUMMER_BOOST[month] & (hour > 10) & (hour < 16)
+        uv = np.where(
+            summer_midday,
+            np.minimum(uv + self._rng.integers(0, 3, len(month)), 11),
+            uv,
+        )
+        uv = np.clip(uv, 0, 11)
 
-        if day != self._last_day:
-            self._daily_rain = 0.0
-            self._max_daily_gust = 0.0
-            self._last_day = day
+        return (
+            np.where(daylight, np.round(solar, 1), 0.0),
+            np.where(daylight, uv, 0).astype(np.int64),
+        )
 
-        if week != self._last_week:
-            self._weekly_rain = 0.0
-            self._last_week = week
+    def generate_readings(self, times: np.ndarray, date_unit: str = "s") -> dict:
+        """
+        Generate weather readings for an array of naive local datetimes.
 
-        if month != self._last_month:
-            self._monthly_rain = 0.0
-            self._last_month = month
+        Readings must be consecutive and follow on from the previous call, as
+        rain events, pressure trends and rain totals carry over between calls.
 
-        if year != self._last_year:
-            self._yearly_rain = 0.0
-            self._last_year = year
+        Args:
+            times: datetime64 array of reading times
+            date_unit: Precision of the ISO "date" strings ("s" or "us")
 
-    def generate_reading(self, dt: datetime) -> dict:
-        """Generate a single weather reading for the given datetime."""
-        self._reset_counters(dt)
+        Returns:
+            Column arrays in READING_COLUMNS order
+        """
+        # Calendar fields for every reading
+        days = times.astype("datetime64[D]")
+        months = times.astype("datetime64[M]")
+        years = times.astype("datetime64[Y]")
+        minute_of_day = (times - days) // np.timedelta64(1, "m")
+        month = months.astype(np.int64) % 12 + 1
+        hour = minute_of_day // 60
+        fractional_hour = hour + (minute_of_day % 60) / 60.0
+        day_of_year = (days - years).astype(np.int64) + 1
+
+        # Periods for rain total resets. ISO weeks start on a Monday, and day 0
+        # of the epoch (1970-01-01) was a Thursday.
+        day_key = days.astype(np.int64)
+        week_key = (day_key + 3) // 7
+        month_key = months.astype(np.int64)
+        year_key = years.astype(np.int64)
 
         # Get pressure first (affects other values)
-        baromrelin, baromabsin = self._update_pressure(dt)
+        baromrelin, baromabsin = self._update_pressure(month)
 
         # Temperature and humidity
-        tempf = self._get_seasonal_temp(dt)
-        humidity = self._get_humidity(dt, tempf)
+        tempf = self._get_seasonal_temp(month, fractional_hour)
+        humidity = self._get_humidity(month, tempf)
 
         # Dew point calculation
         dew_point = tempf - ((100 - humidity) / 5)
 
         # Feels like (simplified heat index / wind chill)
-        wind_speed, wind_dir, wind_gust = self._get_wind(dt, baromrelin)
-
-        if tempf > 80 and humidity > 40:
-            # Heat index
-            feels_like = tempf + (humidity - 40) * 0.1
-        elif tempf < 50 and wind_speed > 3:
-            # Wind chill
-            feels_like = tempf - wind_speed * 0.5
-        else:
-            feels_like = tempf + random.uniform(-2, 2)
+        wind_speed, wind_dir, wind_gust = self._get_wind(month, hour, baromrelin)
+
+        feels_like = np.select(
+            [(tempf > 80) & (humidity > 40), (tempf < 50) & (wind_speed > 3)],
+            [
+                tempf + (humidity - 40) * 0.1,
+                tempf - wind_speed * 0.5,
+            ],  # Heat index, wind chill
+            tempf + self._rng.uniform(-2, 2, len(times)),
+        )
 
         # Rain
-        hourly_rain, event_rain, daily_rain = self._update_rain(dt, baromrelin)
+        hourly_rain, event_rain = self._update_rain(month, hour, baromrelin)
+        daily_rain = _running(hourly_rain, day_key, self._last_day, self._daily_rain)
+        weekly_rain = _running(
+            hourly_rain, week_key, self._last_week, self._weekly_rain
+        )
+        monthly_rain = _running(
+            hourly_rain, month_key, self._last_month, self._monthly_rain
+        )
+        yearly_rain = _running(
+            hourly_rain, year_key, self._last_year, self._yearly_rain
+        )
+        total_rain = self._total_rain + np.cumsum(hourly_rain)
+
+        # Track max daily gust
+        max_daily_gust = _running(
+            wind_gust, day_key, self._last_day, self._max_daily_gust, np.maximum
+        )
 
         # Solar and UV
-        solar, uv = self._get_solar_uv(dt)
+        solar, uv = self._get_solar_uv(month, fractional_hour, day_of_year)
 
-        # Create reading
-        dateutc = int(dt.timestamp() * 1000)
+        dates = np.datetime_as_string(times, unit=date_unit).astype(object)
 
-        reading = {
-            "dateutc": dateutc,
-            "date": dt.isoformat(),
-            "tempf": round(tempf, 1),
-            "feelsLike": round(feels_like, 1),
-            "dewPoint": round(dew_point, 1),
+        # Most recent reading with rain, at or before each reading
+        rain_index = np.maximum.accumulate(
+            np.where(hourly_rain > 0, np.arange(len(times)), -1)
+        )
+        last_rain = dates[rain_index]
+        last_rain[rain_index < 0] = self._last_rain_date
+
+        # Carry state over to the next call
+        self._daily_rain, self._last_day = daily_rain[-1], day_key[-1]
+        self._weekly_rain, self._last_week = weekly_rain[-1], week_key[-1]
+        self._monthly_rain, self._last_month = monthly_rain[-1], month_key[-1]
+        self._yearly_rain, self._last_year = yearly_rain[-1], year_key[-1]
+        self._total_rain = total_rain[-1]
+        self._max_daily_gust = max_daily_gust[-1]
+        self._last_rain_date = last_rain[-1]
+
+        return {
+            "dateutc": _local_dateutc(times),
+            "date": dates,
+            "tempf": np.round(tempf, 1),
+            "feelsLike": np.round(feels_like, 1),
+            "dewPoint": np.round(dew_point, 1),
             "humidity": humidity,
-            "baromrelin": round(baromrelin, 2),
-            "baromabsin": round(baromabsin, 2),
+            "baromrelin": np.round(baromrelin, 2),
+            "baromabsin": np.round(baromabsin, 2),
             "windspeedmph": wind_speed,
             "windgustmph": wind_gust,
             "winddir": wind_dir,
-            "maxdailygust": round(self._max_daily_gust, 1),
-            "hourlyrainin": round(hourly_rain, 3),
-            "eventrain": round(event_rain, 3),
-            "dailyrainin": round(daily_rain, 3),
-            "weeklyrainin": round(self._weekly_rain, 3),
-            "monthlyrainin": round(self._monthly_rain, 3),
-            "yearlyrainin": round(self._yearly_rain, 3),
-            "totalrainin": round(self._total_rain, 3),
+            "maxdailygust": np.round(max_daily_gust, 1),
+            "hourlyrainin": np.round(hourly_rain, 3),
+            "eventrain": np.round(event_rain, 3),
+            "dailyrainin": np.round(daily_rain, 3),
+            "weeklyrainin": np.round(weekly_rain, 3),
+            "monthlyrainin": np.round(monthly_rain, 3),
+            "yearlyrainin": np.round(yearly_rain, 3),
+            "totalrainin": np.round(total_rain, 3),
             "solarradiation": solar,
             "uv": uv,
-            "feelsLikein": round(feels_like, 1),  # Indoor (same as outdoor for demo)
-            "dewPointin": round(dew_point, 1),
-            "lastRain": self._last_rain_date,
+            "feelsLikein": np.round(feels_like, 1),  # Indoor (same as outdoor for demo)
+            "dewPointin": np.round(dew_point, 1),
+            "lastRain": last_rain,
             "tz": SEATTLE_CLIMATE["timezone"],
         }
 
-        return reading
+    def generate_days(
+        self,
+        start_date: datetime,
+        first_day: int,
+        end_day: int,
+        interval_minutes: int = 5,
+    ) -> dict:
+        """
+        Generate the readings within a range of days of a run.
+
+        Args:
+            start_date: Start of the run; readings are interval_minutes apart
+            first_day: First day offset from start_date (inclusive)
+            end_day: Last day offset from start_date (exclusive)
+            interval_minutes: Minutes between readings
+
+        Returns:
+            Column arrays in READING_COLUMNS order
+        """
+        # Indexes of the run's readings falling within these days
+        first = -(-first_day * 24 * 60 // interval_minutes)
+        last = -(-end_day * 24 * 60 // interval_minutes)
+        start = np.datetime64(start_date, "us")
+        interval = np.timedelta64(interval_minutes, "m")
+        times = start + np.arange(first, last) * interval
+
+        # Match datetime.isoformat(), which only shows microseconds when set
+        date_unit = "us" if start_date.microsecond else "s"
+        return self.generate_readings(times, date_unit)
+
+
+def generate_frame(
+    start_date: datetime,
+    days: int = 1095,
+    interval_minutes: int = 5,
+    seed: int | None = None,
+) -> "pd.DataFrame":
+    """
+    Generate Seattle weather readings as a DataFrame, without a database.
+
+    Args:
+        start_date: When to start generating data
+        days: Number of days to generate
+        interval_minutes: Minutes between readings
+        seed: Random seed for reproducible data (default: fresh randomness)
+
+    Returns:
+        One row per reading in time order, with READING_COLUMNS columns
+    """
+    import pandas as pd
+
+    simulator = SeattleWeatherSimulator(seed)
+    chunks = [
+        pd.DataFrame(
+            simulator.generate_days(
+                start_date, day, min(day + CHUNK_DAYS, days), interval_minutes
+            )
+        )
+        for day in range(0, days, CHUNK_DAYS)
+    ]
+    if not chunks:
+        return pd.DataFrame(columns=list(READING_COLUMNS))
+
+    # A local-time DST gap maps two wall-clock times to the same instant;
+    # the first reading for it is kept.
+    frame = pd.concat(chunks, ignore_index=True)
+    return frame.drop_duplicates("dateutc", ignore_index=True)
+
+
+class SeattleWeatherGenerator(SeattleWeatherSimulator):
+    """Generates realistic Seattle weather data into a DuckDB database."""
+
+    def __init__(self, db_path: str | Path, seed: int | None = None) -> None:
+        """
+        Initialize generator with database path.
+
+        Args:
+            db_path: Database file to create or add to
+            seed: Random seed for reproducible data (default: fresh randomness)
+        """
+        # Imported here so simulating readings alone doesn't load DuckDB
+        import duckdb
+
+        super().__init__(seed)
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = duckdb.connect(str(self.db_path))
+        self._create_tables()
+
+    def _create_tables(self) -> None:
+        """Create the weather_data table with same schema as production."""
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS weather_data (
+                dateutc BIGINT PRIMARY KEY,
+                date VARCHAR,
+                tempf DOUBLE,
+                humidity INTEGER,
+                baromabsin DOUBLE,
+                baromrelin DOUBLE,
+                windspeedmph DOUBLE,
+                winddir INTEGER,
+                windgustmph DOUBLE,
+                maxdailygust DOUBLE,
+                hourlyrainin DOUBLE,
+                eventrain DOUBLE,
+                dailyrainin DOUBLE,
+                weeklyrainin DOUBLE,
+                monthlyrainin DOUBLE,
+                yearlyrainin DOUBLE,
+                totalrainin DOUBLE,
+                solarradiation DOUBLE,
+                uv INTEGER,
+                feelsLike DOUBLE,
+                dewPoint DOUBLE,
+                feelsLikein DOUBLE,
+                dewPointin DOUBLE,
+                lastRain VARCHAR,
+                tz VARCHAR,
+                raw_json JSON
+            )
+        """)
+
+        # Demo queries filter on dateutc, which the primary key already
+        # indexes; older demo databases also carry an unused date index
+        self.conn.execute("DROP INDEX IF EXISTS idx_date_dateutc")
 
     def generate(
         self,
@@ -500,6 +786,10 @@ class SeattleWeatherGenerator:
         """
         Generate weather data and insert into database.
 
+        Readings are generated as arrays, CHUNK_DAYS at a time, and each chunk
+        is inserted with a single statement. The load runs in one transaction
+        that is rolled back if generation is cancelled or fails.
+
         Args:
             start_date: When to start generating data
             days: Number of days to generate
@@ -521,50 +811,36 @@ class SeattleWeatherGenerator:
             print(f"Interval: {interval_minutes} minutes")
             print()
 
-        current = start_date
-        end_date = start_date + timedelta(days=days)
         records = 0
-        last_day_reported = -1
-
-        while current < end_date:
-            reading = self.generate_reading(current)
-            reading["raw_json"] = json.dumps(reading)
 
-            # Insert into database
-            columns = list(reading.keys())
-            placeholders = ", ".join(["?" for _ in columns])
-            values = [reading[k] for k in columns]
-
-            try:
-                self.conn.execute(
-                    f"INSERT INTO weather_data ({', '.join(columns)}) VALUES ({placeholders})",
-                    values,
-                )
-                records += 1
-            except duckdb.ConstraintException:
-                # Skip duplicates
-                pass
-
-            # Report progress every 10 days or every 10000 records
-            current_day = (current - start_date).days
-            if (
-                progress_callback
-                and current_day != last_day_reported
-                and current_day % 10 == 0
-            ):
-                progress_callback(current_day, days)
-                last_day_reported = current_day
-
-            # Check for cancellation every day (approx every 288 records at 5min interval)
-            if cancel_check and current_day != last_day_reported and cancel_check():
-                raise GenerationCancelledError(
-                    f"Generation cancelled at day {current_day}/{days}"
+        # One transaction for the whole load: committing each chunk separately
+        # costs more than generating it, and a cancelled or failed run leaves
+        # nothing half-written behind.
+        self.conn.begin()
+        try:
+            for current_day in range(0, days, CHUNK_DAYS):
+                # Report progress and check for cancellation once per chunk
+                if progress_callback:
+                    progress_callback(current_day, days)
+
+                if cancel_check and cancel_check():
+                    raise GenerationCancelledError(
+                        f"Generation cancelled at day {current_day}/{days}"
+                    )
+
+                end_day = min(current_day + CHUNK_DAYS, days)
+                records += self._insert_readings(
+                    self.generate_days(
+                        start_date, current_day, end_day, interval_minutes
+                    )
                 )
+                if not quiet:
+                    print(f"  Generated {records:,} records...")
 
-            if not quiet and records % 10000 == 0 and records > 0:
-                print(f"  Generated {records:,} records...")
-
-            current += timedelta(minutes=interval_minutes)
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
 
         # Final progress callback at 100%
         if progress_callback:
@@ -574,6 +850,39 @@ class SeattleWeatherGenerator:
             print(f"\nCompleted! Generated {records:,} records")
         return records
 
+    def _insert_readings(self, readings: dict) -> int:
+        """
+        Insert generated readings in one statement.
+
+        The columns are registered as a DataFrame and inserted with INSERT ...
+        SELECT, which DuckDB runs as a single vectorized scan; executemany
+        would run a separate insert for every row. Timestamps already in the
+        table are skipped.
+
+        Args:
+            readings: Column arrays in READING_COLUMNS order
+
+        Returns:
+            Number of rows inserted
+        """
+        import pandas as pd
+
+        frame = pd.DataFrame(readings)
+        # A local-time DST gap maps two wall-clock times to the same instant;
+        # as before, the first reading for it is kept.
+        frame = frame.drop_duplicates("dateutc")
+
+        columns = ", ".join(READING_COLUMNS)
+        self.conn.register("reading_batch", frame)
+        try:
+            return self.conn.execute(
+                f"INSERT INTO weather_data ({columns}) "
+                f"SELECT {columns} FROM reading_batch "
+                "ON CONFLICT (dateutc) DO NOTHING"
+            ).fetchone()[0]
+        finally:
+            self.conn.unregister("reading_batch")
+
     def get_stats(self) -> dict:
         """Get database statistics."""
         result = self.conn.execute(
@@ -618,6 +927,12 @@ def main() -> None:
         default=None,
         help="Start date YYYY-MM-DD (default: 3 years ago from today)",
     )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Random seed for reproducible data (default: random)",
+    )
 
     args = parser.parse_args()
 
@@ -645,7 +960,7 @@ def main() -> None:
         print("Removing existing demo database...")
         db_path.unlink()
 
-    generator = SeattleWeatherGenerator(db_path)
+    generator = SeattleWeatherGenerator(db_path, seed=args.seed)
     generator.generate(start_date=start_date, days=args.days)
 
     stats = generator.get_stats()
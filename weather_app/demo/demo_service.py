@@ -6,7 +6,8 @@ to make historical data appear current. Enables users to evaluate the
 Weather Dashboard UI without real hardware.
 """
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
@@ -18,6 +19,18 @@ from weather_app.logging_config import get_logger
 logger = get_logger(__name__)
 
 
+def _shifted_date_sql(column: str, offset_us: int) -> str:
+    """
+    SQL that shifts an ISO date column by offset_us microseconds.
+
+    The result is formatted like datetime.isoformat(), with microseconds only
+    when they're non-zero. Values that don't parse as dates are unchanged.
+    """
+    shifted = f"TRY_CAST({column} AS TIMESTAMP) + to_microseconds({offset_us})"
+    iso = f"strftime({shifted}, '%Y-%m-%dT%H:%M:%S.%f')"
+    return rf"COALESCE(regexp_replace({iso}, '\.000000$', ''), {column})"
+
+
 class DemoService:
     """
     Serves weather data from pre-populated demo database.
@@ -34,6 +47,11 @@ class DemoService:
         "last_data": None,  # Will be set dynamically
     }
 
+    # Readings leave out raw_json, like WeatherRepository's: demo readings
+    # have no API payload, and in older demo databases that stored one it's
+    # the widest column
+    _READING_STAR = "* EXCLUDE (raw_json)"
+
     def __init__(self, demo_db_path: Path | str) -> None:
         """
         Initialize demo service with database path.
@@ -44,6 +62,14 @@ class DemoService:
         self.db_path = Path(demo_db_path)
         self._conn: duckdb.DuckDBPyConnection | None = None
         self._time_offset: timedelta | None = None
+        # Star modifier that time-shifts readings in queries (" REPLACE ...")
+        self._shift_replace = ""
+        # Reading column names, in the order the reading queries return them
+        self._columns: tuple[str, ...] = ()
+        # get_stats() result and latest reading row. The read-only data only
+        # changes on regeneration, and the time offset is fixed when it opens
+        self._stats: dict[str, Any] | None = None
+        self._latest_row: tuple[Any, ...] | None = None
         self._initialized = False
 
         if self.db_path.exists():
@@ -60,6 +86,15 @@ class DemoService:
         try:
             self._conn = duckdb.connect(str(self.db_path), read_only=True)
             self._time_offset = self._calculate_time_offset()
+            self._shift_replace = self._build_shift_replace()
+            self._stats = None
+            self._latest_row = None
+            self._columns = tuple(
+                desc[0]
+                for desc in self._conn.execute(
+                    f"SELECT {self._READING_STAR} FROM weather_data LIMIT 0"
+                ).description
+            )
             self._initialized = True
             logger.info(
                 "demo_service_initialized",
@@ -90,41 +125,43 @@ class DemoService:
 
         return timedelta(0)
 
-    def _shift_timestamp(self, timestamp_ms: int) -> int:
-        """Shift a timestamp by the time offset."""
+    def _build_shift_replace(self) -> str:
+        """
+        Build the REPLACE clause that time-shifts readings in SQL.
+
+        Selecting "*" with this clause returns dateutc, date and lastRain
+        already shifted, so DuckDB shifts every row in the query rather than
+        Python converting each timestamp. Apply it in an outer query, after
+        ORDER BY and LIMIT: the replaced dateutc would otherwise shadow the
+        stored column and be computed for every row before sorting.
+        """
         if not self._time_offset:
-            return timestamp_ms
+            return ""
 
-        original = datetime.fromtimestamp(timestamp_ms / 1000)
-        shifted = original + self._time_offset
-        return int(shifted.timestamp() * 1000)
+        offset_us = self._time_offset // timedelta(microseconds=1)
+        return (
+            f" REPLACE (dateutc + {offset_us // 1000} AS dateutc, "
+            f"{_shifted_date_sql('date', offset_us)} AS date, "
+            f"{_shifted_date_sql('lastRain', offset_us)} AS lastRain)"
+        )
 
-    def _shift_date_string(self, date_str: str | None) -> str | None:
-        """Shift an ISO date string by the time offset."""
-        if not date_str or not self._time_offset:
-            return date_str
+    @contextmanager
+    def _cursor(self) -> Iterator[duckdb.DuckDBPyConnection]:
+        """
+        Open a cursor on the demo database for one query.
 
+        The API serves requests from a thread pool and a DuckDB connection
+        can't be shared between threads. Each cursor is its own connection to
+        the already-open database, so concurrent requests read in parallel
+        without reopening the file.
+        """
+        if self._conn is None:
+            raise RuntimeError("Demo database is not open")
+        cursor = self._conn.cursor()
         try:
-            original = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-            shifted = original + self._time_offset
-            return shifted.isoformat()
-        except (ValueError, TypeError):
-            return date_str
-
-    def _shift_reading(self, reading: dict[str, Any]) -> dict[str, Any]:
-        """Apply time shift to a weather reading."""
-        shifted = reading.copy()
-
-        if "dateutc" in shifted and shifted["dateutc"]:
-            shifted["dateutc"] = self._shift_timestamp(shifted["dateutc"])
-
-        if "date" in shifted and shifted["date"]:
-            shifted["date"] = self._shift_date_string(shifted["date"])
-
-        if "lastRain" in shifted and shifted["lastRain"]:
-            shifted["lastRain"] = self._shift_date_string(shifted["lastRain"])
-
-        return shifted
+            yield cursor
+        finally:
+            cursor.close()
 
     @property
     def is_available(self) -> bool:
@@ -185,22 +222,26 @@ class DemoService:
         """
         Get the most recent weather reading (time-shifted to now).
 
+        Fetched on first call and cached until the database is reopened.
+
         Returns:
             Latest weather reading with timestamps shifted to present
         """
         if not self._conn:
             return None
 
-        result = self._conn.execute("""
-            SELECT * FROM weather_data
-            ORDER BY dateutc DESC
-            LIMIT 1
-            """).fetchone()
+        if self._latest_row is None:
+            with self._cursor() as cursor:
+                self._latest_row = cursor.execute(f"""
+                    SELECT {self._READING_STAR}{self._shift_replace} FROM (
+                        SELECT * FROM weather_data
+                        ORDER BY dateutc DESC
+                        LIMIT 1
+                    )
+                    """).fetchone()
 
-        if result:
-            columns = [desc[0] for desc in self._conn.description]
-            reading = dict(zip(columns, result))
-            return self._shift_reading(reading)
+        if self._latest_row:
+            return dict(zip(self._columns, self._latest_row))
 
         return None
 
@@ -224,40 +265,43 @@ class DemoService:
 
         Returns:
             List of weather readings with time-shifted timestamps
+
+        Raises:
+            ValueError: If start_date or end_date is not an ISO date
         """
         if not self._conn:
             return []
 
-        # Convert shifted dates back to demo database time for query
-        query_start = self._unshift_date(start_date) if start_date else None
-        query_end = self._unshift_date(end_date) if end_date else None
-
         conditions: list[str] = []
-        params: list[str | int] = []
+        params: list[int] = []
 
-        if query_start:
-            conditions.append("date >= ?")
-            params.append(query_start)
+        # Convert shifted dates back to demo database time for query
+        if start_date:
+            conditions.append("dateutc >= ?")
+            params.append(self._unshift_dateutc(start_date, "start_date"))
 
-        if query_end:
-            conditions.append("date <= ?")
-            params.append(query_end)
+        if end_date:
+            conditions.append("dateutc <= ?")
+            params.append(self._unshift_dateutc(end_date, "end_date"))
 
         where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
         order_clause = "DESC" if order.lower() == "desc" else "ASC"
 
         query = f"""
-            SELECT * FROM weather_data
-            {where_clause}
+            SELECT {self._READING_STAR}{self._shift_replace} FROM (
+                SELECT * FROM weather_data
+                {where_clause}
+                ORDER BY dateutc {order_clause}
+                LIMIT ? OFFSET ?
+            )
             ORDER BY dateutc {order_clause}
-            LIMIT ? OFFSET ?
         """
         params.extend([limit, offset])
 
-        results = self._conn.execute(query, params).fetchall()
-        columns = [desc[0] for desc in self._conn.description]
-
-        return [self._shift_reading(dict(zip(columns, row))) for row in results]
+        with self._cursor() as cursor:
+            results = cursor.execute(query, params).fetchall()
+        columns = self._columns
+        return [dict(zip(columns, row)) for row in results]
 
     def get_sampled_readings(
         self,
@@ -275,22 +319,26 @@ class DemoService:
 
         Returns:
             Evenly distributed readings with time-shifted timestamps
+
+        Raises:
+            ValueError: If start_date or end_date is not an ISO date
         """
         if not self._conn:
             return []
 
         # Convert shifted dates back to demo database time
-        query_start = self._unshift_date(start_date)
-        query_end = self._unshift_date(end_date)
+        query_start = self._unshift_dateutc(start_date, "start_date")
+        query_end = self._unshift_dateutc(end_date, "end_date")
 
         # Get total count in range
-        count_result = self._conn.execute(
-            """
-            SELECT COUNT(*) FROM weather_data
-            WHERE date >= ? AND date <= ?
-            """,
-            [query_start, query_end],
-        ).fetchone()
+        with self._cursor() as cursor:
+            count_result = cursor.execute(
+                """
+                SELECT COUNT(*) FROM weather_data
+                WHERE dateutc >= ? AND dateutc <= ?
+                """,
+                [query_start, query_end],
+            ).fetchone()
 
         total_count = count_result[0] if count_result else 0
 
@@ -303,55 +351,82 @@ class DemoService:
                 order="asc",
             )
 
-        # Sample evenly using row numbers
+        # Sample evenly using row numbers. Only dateutc is numbered (the
+        # window sorts one BIGINT column instead of whole rows), then the
+        # picked readings are fetched by key.
         sample_interval = total_count // target_count
 
-        query = """
+        query = f"""
             WITH numbered AS (
-                SELECT *, ROW_NUMBER() OVER (ORDER BY dateutc ASC) as rn
+                SELECT dateutc, ROW_NUMBER() OVER (ORDER BY dateutc ASC) as rn
                 FROM weather_data
-                WHERE date >= ? AND date <= ?
+                WHERE dateutc >= ? AND dateutc <= ?
+            ),
+            picks AS (
+                SELECT dateutc FROM numbered
+                WHERE (rn - 1) % ? = 0
+                ORDER BY dateutc ASC
+                LIMIT ?
             )
-            SELECT * FROM numbered
-            WHERE (rn - 1) % ? = 0
+            SELECT {self._READING_STAR}{self._shift_replace} FROM weather_data
+            WHERE dateutc IN (SELECT dateutc FROM picks)
             ORDER BY dateutc ASC
-            LIMIT ?
         """
 
-        results = self._conn.execute(
-            query, [query_start, query_end, sample_interval, target_count]
-        ).fetchall()
+        with self._cursor() as cursor:
+            results = cursor.execute(
+                query, [query_start, query_end, sample_interval, target_count]
+            ).fetchall()
 
-        readings = []
-        for row in results:
-            # Create dict excluding the rn column
-            reading = {}
-            for i, col in enumerate(self._conn.description):
-                if col[0] != "rn":
-                    reading[col[0]] = row[i]
-            readings.append(self._shift_reading(reading))
+        columns = self._columns
+        return [dict(zip(columns, row)) for row in results]
 
-        return readings
+    def _unshift_dateutc(self, date_str: str, name: str) -> int:
+        """
+        Convert a shifted ISO date to a dateutc bound in demo database time.
 
-    def _unshift_date(self, date_str: str | None) -> str | None:
-        """Convert a shifted date back to demo database time."""
-        if not date_str or not self._time_offset:
-            return date_str
+        Filters compare the BIGINT dateutc column, which DuckDB can skip
+        through by row group, rather than the date strings. Dates without an
+        offset are local time, like the generated date column.
 
+        Args:
+            date_str: ISO date or datetime, in shifted time
+            name: Parameter name for the error message
+
+        Returns:
+            Milliseconds since epoch in demo database time
+
+        Raises:
+            ValueError: If date_str is not an ISO date
+        """
         try:
-            shifted = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-            original = shifted - self._time_offset
-            return original.isoformat()
-        except (ValueError, TypeError):
-            return date_str
+            original = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+        except ValueError:
+            raise ValueError(f"Invalid {name} format. Use YYYY-MM-DD")
+
+        if self._time_offset:
+            original -= self._time_offset
+        return int(original.timestamp() * 1000)
 
     def get_stats(self) -> dict[str, Any]:
         """
         Get database statistics (with time-shifted dates).
 
+        Computed on first call and cached until the database is reopened.
+
         Returns:
             Stats including total records and date range
         """
+        # Nothing to cache until the database is open
+        if not self._conn:
+            return self._compute_stats()
+
+        if self._stats is None:
+            self._stats = self._compute_stats()
+        return self._stats.copy()
+
+    def _compute_stats(self) -> dict[str, Any]:
+        """Query record count and shifted date range."""
         if not self._conn:
             return {
                 "total_records": 0,
@@ -360,35 +435,30 @@ class DemoService:
                 "date_range_days": None,
             }
 
-        result = self._conn.execute("""
-            SELECT
-                COUNT(*) as total_records,
-                MIN(date) as min_date,
-                MAX(date) as max_date
-            FROM weather_data
-            """).fetchone()
+        # Shift dates to present and take the range from dateutc in SQL, so
+        # no date strings are parsed in Python
+        min_date, max_date = "MIN(date)", "MAX(date)"
+        if self._time_offset:
+            offset_us = self._time_offset // timedelta(microseconds=1)
+            min_date = _shifted_date_sql(min_date, offset_us)
+            max_date = _shifted_date_sql(max_date, offset_us)
+
+        with self._cursor() as cursor:
+            result = cursor.execute(f"""
+                SELECT
+                    COUNT(*) as total_records,
+                    {min_date} as min_date,
+                    {max_date} as max_date,
+                    (MAX(dateutc) - MIN(dateutc)) // 86400000 as date_range_days
+                FROM weather_data
+                """).fetchone()
 
         if result:
-            total_records, min_date, max_date = result
-
-            # Shift dates to present
-            shifted_min = self._shift_date_string(min_date)
-            shifted_max = self._shift_date_string(max_date)
-
-            # Calculate date range
-            date_range_days = None
-            if shifted_min and shifted_max:
-                try:
-                    min_dt = datetime.fromisoformat(shifted_min.replace("Z", "+00:00"))
-                    max_dt = datetime.fromisoformat(shifted_max.replace("Z", "+00:00"))
-                    date_range_days = (max_dt - min_dt).days
-                except (ValueError, TypeError):
-                    pass
-
+            total_records, min_date, max_date, date_range_days = result
             return {
                 "total_records": total_records,
-                "min_date": shifted_min,
-                "max_date": shifted_max,
+                "min_date": min_date,
+                "max_date": max_date,
                 "date_range_days": date_range_days,
             }
 
@@ -414,4 +484,6 @@ class DemoService:
         if self._conn:
             self._conn.close()
             self._conn = None
+            self._stats = None
+            self._latest_row = None
             self._initialized = False
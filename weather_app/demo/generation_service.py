@@ -18,12 +18,6 @@ from weather_app.logging_config import get_logger
 logger = get_logger(__name__)
 
 
-class GenerationCancelledError(Exception):
-    """Raised when generation is cancelled by user."""
-
-    pass
-
-
 GenerationState = Literal["idle", "generating", "completed", "failed", "cancelled"]
 
 
@@ -207,10 +201,14 @@ class DemoGenerationService:
         Args:
             days: Number of days of data to generate
         """
-        try:
-            # Import here to avoid circular imports
-            from weather_app.demo.data_generator import SeattleWeatherGenerator
+        # Imported here so the generator only loads when a generation runs. The
+        # cancellation error must be the generator's own class to be caught below.
+        from weather_app.demo.data_generator import (
+            GenerationCancelledError,
+            SeattleWeatherGenerator,
+        )
 
+        try:
             # Remove existing database if present
             if DEMO_DB_PATH.exists():
                 logger.info("demo_generation_removing_existing", path=str(DEMO_DB_PATH))
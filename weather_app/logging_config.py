@@ -35,6 +35,8 @@ def configure_logging(level: str = "INFO", json_logs: bool = True) -> None:
 
     # Build processor chain
     processors = [
+        # Drop events below the configured level before any other processing
+        structlog.stdlib.filter_by_level,
         # Add log level
         structlog.stdlib.add_log_level,
         # Add timestamp
@@ -177,6 +179,11 @@ def log_database_operation(
         duration_ms: Optional operation duration in milliseconds
         error: Optional error message
     """
+    # Successful operations log at INFO; skip building the payload when that's
+    # filtered out, as this runs on every query
+    if not error and not logger.isEnabledFor(logging.INFO):
+        return
+
     log_data: dict[str, Any] = {
         "event": "database_operation",
         "operation": operation,
@@ -458,7 +458,7 @@ class BackfillService:
             def batch_callback(batch_data: list) -> tuple[int, int]:
                 """Save each batch as it arrives."""
                 with WeatherDatabase() as db:
-                    inserted, skipped = db.insert_data(batch_data)
+                    inserted, skipped = db.insert_data(batch_data, mode="insert_only")
 
                     # Update current date from newest record in batch
                     if batch_data:
@@ -10,7 +10,8 @@ class WeatherData(BaseModel):
 
     model_config = ConfigDict(from_attributes=True)
 
-    id: int
+    # Only present for demo databases generated before dateutc became the key
+    id: int | None = None
     dateutc: int
     date: str
     tempf: float | None = None
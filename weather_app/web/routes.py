@@ -74,6 +74,13 @@ def register_routes(app: FastAPI):
             pattern="^(asc|desc)$",
             description="Sort order by date (asc or desc)",
         ),
+        cursor: int | None = Query(
+            default=None,
+            description=(
+                "dateutc of the last record of the previous page; "
+                "can't be combined with offset"
+            ),
+        ),
     ):
         """
         Query weather data from the database
@@ -84,6 +91,9 @@ def register_routes(app: FastAPI):
         - start_date: Filter by start date (YYYY-MM-DD format)
         - end_date: Filter by end date (YYYY-MM-DD format)
         - order: Sort order - 'asc' or 'desc' (default: desc)
+        - cursor: Return records after this dateutc (keyset pagination; pass
+          the last record's dateutc to fetch the next page without an offset).
+          A nonzero offset with a cursor is rejected with 400.
         """
         start_time = time.time()
         try:
@@ -93,6 +103,7 @@ def register_routes(app: FastAPI):
                 start_date=start_date,
                 end_date=end_date,
                 order=order,
+                cursor=cursor,
             )
 
             duration_ms = (time.time() - start_time) * 1000
@@ -241,7 +252,11 @@ def register_routes(app: FastAPI):
             },
         }
 
-    # Add API prefix routes for frontend compatibility
+    # Add API prefix routes for frontend compatibility.
+    # The reading lists below (up to 10 000 rows) are returned as JSONResponse
+    # directly: rows already hold plain JSON values, and FastAPI's default
+    # jsonable_encoder pass over every value costs several times the
+    # serialization itself.
     @app.get("/api/weather/latest")
     def api_get_latest_weather(limit: int = Query(default=100, ge=1, le=10000)):
         """
@@ -254,11 +269,13 @@ def register_routes(app: FastAPI):
             if is_demo_mode():
                 demo_service = get_demo_service()
                 if demo_service and demo_service.is_available:
-                    return demo_service.get_all_readings(limit=limit, order="desc")
+                    return JSONResponse(
+                        demo_service.get_all_readings(limit=limit, order="desc")
+                    )
                 raise HTTPException(status_code=503, detail="Demo service unavailable")
 
             results = WeatherRepository.get_all_readings(limit=limit, order="desc")
-            return results
+            return JSONResponse(results)
         except RuntimeError as e:
             raise HTTPException(status_code=500, detail=str(e))
 
@@ -286,26 +303,34 @@ def register_routes(app: FastAPI):
                     )
 
                 if start_date and end_date:
-                    return demo_service.get_sampled_readings(
-                        start_date=start_date,
-                        end_date=end_date,
-                        target_count=limit,
+                    return JSONResponse(
+                        demo_service.get_sampled_readings(
+                            start_date=start_date,
+                            end_date=end_date,
+                            target_count=limit,
+                        )
                     )
                 else:
-                    return demo_service.get_all_readings(limit=limit, order="desc")
+                    return JSONResponse(
+                        demo_service.get_all_readings(limit=limit, order="desc")
+                    )
 
             if start_date and end_date:
                 # Use sampling for date range queries to ensure even distribution
-                return WeatherRepository.get_sampled_readings(
-                    start_date=start_date,
-                    end_date=end_date,
-                    target_count=limit,
+                return JSONResponse(
+                    WeatherRepository.get_sampled_readings(
+                        start_date=start_date,
+                        end_date=end_date,
+                        target_count=limit,
+                    )
                 )
             else:
                 # No date range specified - return most recent records
-                return WeatherRepository.get_all_readings(
-                    limit=limit,
-                    order="desc",
+                return JSONResponse(
+                    WeatherRepository.get_all_readings(
+                        limit=limit,
+                        order="desc",
+                    )
                 )
         except ValueError as e:
             raise HTTPException(status_code=400, detail=str(e))
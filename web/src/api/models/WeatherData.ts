@@ -6,7 +6,7 @@
  * Response model for weather data records
  */
 export type WeatherData = {
-    id: number;
+    id?: (number | null);
     dateutc: number;
     date: string;
     tempf?: (number | null);
@@ -30,11 +30,14 @@ export class DefaultService {
      * - start_date: Filter by start date (YYYY-MM-DD format)
      * - end_date: Filter by end date (YYYY-MM-DD format)
      * - order: Sort order - 'asc' or 'desc' (default: desc)
+     * - cursor: Return records after this dateutc (keyset pagination; pass
+     * the last record's dateutc to fetch the next page without an offset)
      * @param limit Maximum number of records to return
      * @param offset Number of records to skip
      * @param startDate Start date (ISO format: YYYY-MM-DD)
      * @param endDate End date (ISO format: YYYY-MM-DD)
      * @param order Sort order by date (asc or desc)
+     * @param cursor dateutc of the last record of the previous page
      * @returns WeatherData Successful Response
      * @throws ApiError
      */
@@ -44,6 +47,7 @@ export class DefaultService {
         startDate?: (string | null),
         endDate?: (string | null),
         order: string = 'desc',
+        cursor?: (number | null),
     ): CancelablePromise<Array<WeatherData>> {
         return __request(OpenAPI, {
             method: 'GET',
@@ -54,6 +58,7 @@ export class DefaultService {
                 'start_date': startDate,
                 'end_date': endDate,
                 'order': order,
+                'cursor': cursor,
             },
             errors: {
                 422: `Validation Error`,